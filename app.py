@@ -3,39 +3,50 @@ import os
 import io
 import json
 import re
-import textwrap
-import tiktoken
 import unicodedata
 import streamlit as st
-import PyPDF2
+from pdf_extraction import extract_pdf_pages, resolve_backend as resolve_pdf_backend
+import service_backends
+import metrics_exporter
 from groq import Groq
-from fpdf import FPDF
-import pandas as pd
+from lazy_imports import lazy_import
+import numpy as np
 import hashlib
+import math
+import sqlite3
 import requests
 from datetime import datetime
 import base64
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import time
-from streamlit_option_menu import option_menu
-from streamlit_lottie import st_lottie
-import streamlit.components.v1 as components
+import threading
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from groq.types.chat import ChatCompletion
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Heavy modules only some sessions reach (charts, tables, tokenization) load on first use
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+tiktoken = lazy_import("tiktoken")
 
 # Load environment variables
 load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 
-if not GROQ_API_KEY:
+# Replay and stub backends answer locally, so they run without credentials
+if not GROQ_API_KEY and not service_backends.is_offline(service_backends.LLM_BACKEND):
     st.error("GROQ_API_KEY not found. Please set it in your .env file.")
     st.stop()
 
-if not GITHUB_TOKEN:
+if not GITHUB_TOKEN and not service_backends.is_offline(service_backends.GITHUB_BACKEND):
     st.warning("GITHUB_TOKEN not found. GitHub API calls will be limited without authentication.")
 
-client = Groq(api_key=GROQ_API_KEY)
+client = Groq(api_key=GROQ_API_KEY or "offline", http_client=service_backends.groq_http_client())
+
+# Prometheus endpoint/textfile, when configured; started once per process
+metrics_exporter.start_exporters()
 
 MODEL_OPTIONS = [
     "allam-2-7b",
@@ -62,6 +73,248 @@ MODEL_OPTIONS = [
     "playai-tts-arabic",
 ]
 
+# Context window (prompt + completion tokens) per chat model; unknown models get the default
+DEFAULT_CONTEXT_WINDOW = 8192
+MODEL_CONTEXT_WINDOWS = {
+    "allam-2-7b": 4096,
+    "compound-beta": 131072,
+    "compound-beta-mini": 131072,
+    "deepseek-r1-distill-llama-70b": 131072,
+    "gemma2-9b-it": 8192,
+    "llama-3.1-8b-instant": 131072,
+    "llama-3.3-70b-versatile": 131072,
+    "llama3-70b-8192": 8192,
+    "llama3-8b-8192": 8192,
+    "meta-llama/llama-4-maverick-17b-128e-instruct": 131072,
+    "meta-llama/llama-4-scout-17b-16e-instruct": 131072,
+    "meta-llama/llama-guard-4-12b": 131072,
+    "meta-llama/llama-prompt-guard-2-22m": 512,
+    "meta-llama/llama-prompt-guard-2-86m": 512,
+    "mistral-saba-24b": 32768,
+    "qwen-qwq-32b": 131072,
+    "qwen/qwen3-32b": 131072,
+}
+
+# Expected completion size per call type. Requests ask for no more than this, so short
+# structured calls (a five-field JSON object) do not reserve thousands of output tokens
+DEFAULT_OUTPUT_TOKENS = 1024
+ANALYSIS_OUTPUT_TOKENS = {
+    "profile_fit": 2048,
+    "keyword_match": 2048,
+    "qa": 1024,
+    "category_scores": 128,
+    "section_summary": 700,
+    "project_description": 512,
+}
+# Reasoning models spend part of the completion on their thinking before the answer
+MODEL_REASONING_TOKENS = {
+    "deepseek-r1-distill-llama-70b": 2048,
+    "qwen-qwq-32b": 2048,
+    "qwen/qwen3-32b": 2048,
+}
+
+# On-disk cache settings
+CACHE_DIR = os.getenv("RESUMEMATCH_CACHE_DIR", ".resumematch_cache")
+if service_backends.backend_label():
+    # Keep recorded and synthetic responses out of the caches used against the live APIs
+    CACHE_DIR = os.path.join(CACHE_DIR, "backends", service_backends.backend_label())
+LLM_CACHE_MAX_MB = float(os.getenv("RESUMEMATCH_LLM_CACHE_MAX_MB", "256"))
+LLM_CACHE_TTL_HOURS = float(os.getenv("RESUMEMATCH_LLM_CACHE_TTL_HOURS", "168"))
+PDF_CACHE_MAX_MB = float(os.getenv("RESUMEMATCH_PDF_CACHE_MAX_MB", "64"))
+PDF_MEMORY_CACHE_ENTRIES = int(os.getenv("RESUMEMATCH_PDF_MEMORY_CACHE_ENTRIES", "32"))
+
+class DiskCache:
+    """Content-addressed JSON cache on disk with TTL expiry and size-bounded LRU eviction."""
+
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: float = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    @staticmethod
+    def make_key(payload) -> str:
+        """Hash any JSON-serialisable payload into a stable cache key."""
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self) -> list:
+        """Return (mtime, size, path) for every entry, oldest access first."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def get(self, key: str):
+        """Return the cached value for key, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    entry = json.load(fh)
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                self.misses += 1
+                return None
+
+            if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+                self._remove(path)
+                self.misses += 1
+                return None
+
+            # Touch the file so eviction treats it as recently used
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            self.hits += 1
+            return entry.get("value")
+
+    def set(self, key: str, value) -> None:
+        """Store value under key and evict least recently used entries if over budget."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        data = json.dumps({"created_at": time.time(), "value": value}, ensure_ascii=False)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            if os.path.exists(path):
+                self._remove(path)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+            self._total_bytes += os.path.getsize(path)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        if self._total_bytes is not None:
+            self._total_bytes = max(0, self._total_bytes - size)
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until the cache is back under budget."""
+        entries = self._scan()
+        self._total_bytes = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            if self._total_bytes <= self.max_bytes * 0.9:
+                break
+            self._remove(path)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0
+        }
+
+class SpanTimings:
+    """Thread-safe per-stage timing aggregates: calls, total, mean, max and last duration."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0, "last": 0.0})
+            stats["calls"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["last"] = seconds
+
+    def snapshot(self) -> dict:
+        """Return {stage: {calls, total_ms, mean_ms, max_ms, last_ms}}, slowest total first."""
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: item[1]["total"], reverse=True)
+            return {
+                name: {
+                    "calls": stats["calls"],
+                    "total_ms": round(stats["total"] * 1000, 1),
+                    "mean_ms": round(stats["total"] / stats["calls"] * 1000, 1),
+                    "max_ms": round(stats["max"] * 1000, 1),
+                    "last_ms": round(stats["last"] * 1000, 1)
+                }
+                for name, stats in items
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+# Used outside a Streamlit session (batch scoring, benchmarks)
+_process_span_timings = SpanTimings()
+
+def get_span_timings() -> SpanTimings:
+    """Return the current session's timings, or the process-wide recorder outside a session."""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return _process_span_timings
+    return st.session_state.get("span_timings", _process_span_timings)
+
+@contextmanager
+def timed_span(name: str):
+    """Time a block (or, as a decorator, every call of a function) under a stage name."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        get_span_timings().record(name, time.perf_counter() - start)
+
+@st.cache_resource(show_spinner=False)
+def _llm_response_cache() -> DiskCache:
+    # Held by Streamlit so the hit/miss counters outlive each rerun of this script
+    return DiskCache(
+        os.path.join(CACHE_DIR, "llm"),
+        max_bytes=int(LLM_CACHE_MAX_MB * 1024 * 1024),
+        ttl_seconds=LLM_CACHE_TTL_HOURS * 3600
+    )
+
+llm_cache = _llm_response_cache()
+
+pdf_text_cache = DiskCache(
+    os.path.join(CACHE_DIR, "pdf_text"),
+    max_bytes=int(PDF_CACHE_MAX_MB * 1024 * 1024)
+)
+
+@st.cache_resource(show_spinner=False)
+def _pdf_text_memory_cache():
+    # Held by Streamlit rather than this module, which is re-executed on every rerun
+    return OrderedDict(), threading.Lock()
+
+# Small in-process LRU in front of pdf_text_cache so reruns never touch the disk
+_pdf_text_memo, _pdf_text_memo_lock = _pdf_text_memory_cache()
+
 # Enhanced weighted scoring function
 def weighted_score(categories):
     """Calculate weighted overall score based on category importance"""
@@ -831,6 +1084,37 @@ def show_loading_animation(message="Processing..."):
     </div>
     """, unsafe_allow_html=True)
 
+def render_performance_panel():
+    """Show per-stage timings for this session."""
+    if st.button("Reset timings", key="reset_span_timings"):
+        get_span_timings().reset()
+    
+    timings = get_span_timings().snapshot()
+    if not timings:
+        st.caption("No timed stages yet. Run an analysis to see where the time goes.")
+        return
+    
+    st.dataframe(
+        pd.DataFrame([{"Stage": name, **stats} for name, stats in timings.items()]).rename(columns={
+            "calls": "Calls", "total_ms": "Total ms", "mean_ms": "Mean ms", "max_ms": "Max ms", "last_ms": "Last ms"
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
+
+# Streamed-analysis metrics kept per session, oldest dropped first
+STREAM_METRICS_HISTORY = 50
+
+def show_stream_metrics(metrics: dict):
+    """Show time-to-first-token for a streamed analysis and keep it for the session."""
+    if "time_to_first_token" not in metrics:
+        return
+    if metrics.get("cached"):
+        st.caption("⚡ Served from the response cache")
+    else:
+        st.caption(f"⚡ First token after {metrics['time_to_first_token']:.2f}s · complete after {metrics['total_time']:.2f}s")
+    st.session_state.setdefault("stream_metrics", deque(maxlen=STREAM_METRICS_HISTORY)).append(metrics)
+
 def create_enhanced_charts(categories):
     """Create enhanced interactive charts with black and green color scheme."""
     # Radar chart with new colors
@@ -1018,12 +1302,52 @@ def sanitize_text(s: str) -> str:
     
     return clean_text.strip()
 
-def count_tokens(text: str, model: str) -> int:
-    try:
-        enc = tiktoken.encoding_for_model(model)
-    except KeyError:
-        enc = tiktoken.get_encoding("cl100k_base")
-    return len(enc.encode(text))
+# Token counting settings
+TOKEN_COUNT_MEMO_ENTRIES = int(os.getenv("RESUMEMATCH_TOKEN_COUNT_MEMO_ENTRIES", "256"))
+
+@st.cache_resource(show_spinner=False)
+def _token_counting_state():
+    # Held by Streamlit rather than this module, which is re-executed on every rerun
+    return {}, threading.Lock(), OrderedDict(), threading.Lock()
+
+_encoders, _encoders_lock, _token_count_memo, _token_count_memo_lock = _token_counting_state()
+
+def get_encoder(model: str) -> "tiktoken.Encoding":
+    """Return the tiktoken encoder for model, resolving each model name only once.
+
+    Groq model names are unknown to tiktoken, so they fall back to cl100k_base.
+    """
+    enc = _encoders.get(model)
+    if enc is None:
+        with _encoders_lock:
+            enc = _encoders.get(model)
+            if enc is None:
+                try:
+                    enc = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    enc = tiktoken.get_encoding("cl100k_base")
+                _encoders[model] = enc
+    return enc
+
+def count_tokens(text: str, model: str, memoize: bool = False) -> int:
+    """Count tokens in text; with memoize, repeated identical texts are counted once."""
+    enc = get_encoder(model)
+    if not memoize or TOKEN_COUNT_MEMO_ENTRIES <= 0:
+        return len(enc.encode(text))
+    
+    # Models sharing an encoding share memo entries
+    memo_key = (enc.name, hashlib.sha256(text.encode("utf-8")).hexdigest())
+    with _token_count_memo_lock:
+        if memo_key in _token_count_memo:
+            _token_count_memo.move_to_end(memo_key)
+            return _token_count_memo[memo_key]
+    
+    count = len(enc.encode(text))
+    with _token_count_memo_lock:
+        _token_count_memo[memo_key] = count
+        while len(_token_count_memo) > TOKEN_COUNT_MEMO_ENTRIES:
+            _token_count_memo.popitem(last=False)
+    return count
 
 def generate_deterministic_seed(job_desc: str, resume_text: str, analysis_type: str) -> int:
     """Generate a consistent seed based on input content for reproducible results."""
@@ -1031,22 +1355,168 @@ def generate_deterministic_seed(job_desc: str, resume_text: str, analysis_type:
     hash_object = hashlib.md5(combined_text.encode())
     return int(hash_object.hexdigest()[:8], 16) % 1000000
 
-def get_deterministic_params(system_prompt: str, job_desc: str, model: str):
-    """Get deterministic parameters for consistent results."""
-    used = count_tokens(system_prompt + job_desc, model)
-    max_tokens = max(512, 8192 - used - 200)
+def get_context_window(model: str) -> int:
+    return MODEL_CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW)
+
+def get_output_token_budget(analysis_type: str, model: str) -> int:
+    """Expected completion tokens for one call type on one model."""
+    return ANALYSIS_OUTPUT_TOKENS.get(analysis_type, DEFAULT_OUTPUT_TOKENS) + MODEL_REASONING_TOKENS.get(model, 0)
+
+def get_deterministic_params(system_prompt: str, job_desc: str, model: str, analysis_type: str, extra_tokens: int = 0):
+    """Get deterministic parameters for consistent results.
+
+    max_tokens is the analysis type's output budget, cut down when the prompt leaves
+    less room in the model's context window. extra_tokens counts prompt content beyond
+    system_prompt and job_desc (such as the resume).
+    """
+    budget = get_output_token_budget(analysis_type, model)
+    used = count_tokens(system_prompt + job_desc, model, memoize=True)
+    remaining_context = get_context_window(model) - used - extra_tokens - 200
+    max_tokens = max(min(budget, 512), min(budget, remaining_context))
     
     temperature = 0.0000000000000001
     top_p = 0.0000000000000001
     
     return max_tokens, temperature, top_p
 
-def extract_text_from_pdf(f) -> str:
-    reader = PyPDF2.PdfReader(f)
-    return "\n".join(page.extract_text() or "" for page in reader.pages)
+def _read_pdf_bytes(f) -> bytes:
+    """Return the raw bytes of an uploaded file, file object, path or bytes."""
+    if isinstance(f, (bytes, bytearray)):
+        return bytes(f)
+    if isinstance(f, (str, os.PathLike)):
+        with open(f, "rb") as fh:
+            return fh.read()
+    if hasattr(f, "getvalue"):
+        return f.getvalue()
+    position = f.tell()
+    data = f.read()
+    f.seek(position)
+    return data
 
-def chunk_text(text: str, max_chars: int = 3000):
-    return textwrap.wrap(text, max_chars)
+@timed_span("pdf_extraction")
+def extract_text_from_pdf(f, progress_callback=None) -> str:
+    """Extract text from a PDF, memoized by a hash of the file bytes.
+
+    Lookups go to the in-memory LRU, then the on-disk cache, and only parse the
+    document on a miss; progress_callback(pages_done, total_pages) is called per page parsed.
+    """
+    data = _read_pdf_bytes(f)
+    # Backends differ slightly in whitespace handling, so each gets its own cache entries
+    backend = resolve_pdf_backend()
+    cache_key = f"{backend}-{hashlib.sha256(data).hexdigest()}"
+    
+    with _pdf_text_memo_lock:
+        if cache_key in _pdf_text_memo:
+            _pdf_text_memo.move_to_end(cache_key)
+            return _pdf_text_memo[cache_key]
+    
+    text = pdf_text_cache.get(cache_key)
+    if text is None:
+        text = _parse_pdf_text(data, backend, progress_callback)
+        try:
+            pdf_text_cache.set(cache_key, text)
+        except Exception:
+            pass
+    
+    with _pdf_text_memo_lock:
+        _pdf_text_memo[cache_key] = text
+        while len(_pdf_text_memo) > PDF_MEMORY_CACHE_ENTRIES:
+            _pdf_text_memo.popitem(last=False)
+    return text
+
+def _parse_pdf_text(data: bytes, backend: str, progress_callback=None) -> str:
+    return "\n".join(extract_pdf_pages(data, backend=backend, progress_callback=progress_callback))
+
+# Resume chunking settings
+CHUNK_MAX_TOKENS = int(os.getenv("RESUMEMATCH_CHUNK_MAX_TOKENS", "750"))
+
+RESUME_SECTION_HEADERS = {
+    "summary", "professional summary", "profile", "objective", "career objective", "about me",
+    "experience", "work experience", "professional experience", "employment", "employment history",
+    "work history", "internships", "internship", "education", "academic background", "skills",
+    "technical skills", "core competencies", "key skills", "projects", "key projects",
+    "personal projects", "academic projects", "technical projects", "relevant projects",
+    "university projects", "certifications", "certificates", "licenses and certifications",
+    "awards", "honors", "achievements", "accomplishments", "publications", "research",
+    "languages", "interests", "hobbies", "volunteer experience", "volunteering", "leadership",
+    "activities", "extracurricular activities", "courses", "coursework", "references"
+}
+
+def is_section_header(line: str) -> bool:
+    """Detect resume section headers: known titles, or short all-caps lines such as "WORK HISTORY"."""
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped) > 40:
+        return False
+    if stripped.lower() in RESUME_SECTION_HEADERS:
+        return True
+    letters = [c for c in stripped if c.isalpha()]
+    return (len(letters) >= 3 and stripped.isupper() and len(stripped.split()) <= 4
+            and all(c.isalpha() or c in " &/-" for c in stripped))
+
+def _iter_sections(text: str):
+    """Yield (section title, start, end) spans; text before the first header is "Header"."""
+    section, section_start, offset = "Header", 0, 0
+    for line in text.splitlines(keepends=True):
+        if is_section_header(line) and text[section_start:offset].strip():
+            yield section, section_start, offset
+            section, section_start = line.strip().rstrip(":").strip().title(), offset
+        elif is_section_header(line):
+            section = line.strip().rstrip(":").strip().title()
+        offset += len(line)
+    if text[section_start:].strip():
+        yield section, section_start, len(text)
+
+# Progressively finer split points used when a span is over the token budget
+_CHUNK_SPLIT_PATTERNS = [re.compile(r"\S.*?(?:\n\s*\n|\Z)", re.DOTALL),   # paragraphs
+                         re.compile(r"\S.*?(?:\n|\Z)"),                       # lines
+                         re.compile(r"\S+\s*")]                                # words
+
+def _pack_spans(text: str, start: int, end: int, max_tokens: int, model: str, level: int = 0,
+                carry_start: int = None, carry_tokens: int = 0):
+    """Greedily pack units of text[start:end] into (start, end, tokens) spans of at most max_tokens.
+
+    carry_start/carry_tokens continue a partial chunk handed down from a coarser level,
+    so a section header is not left alone when the paragraph after it must be split.
+    """
+    chunk_start, chunk_end, chunk_tokens = carry_start, start, carry_tokens
+    for match in _CHUNK_SPLIT_PATTERNS[level].finditer(text, start, end):
+        unit_tokens = count_tokens(match.group(), model)
+        if unit_tokens > max_tokens and level + 1 < len(_CHUNK_SPLIT_PATTERNS):
+            yield from _pack_spans(text, match.start(), match.end(), max_tokens, model, level + 1,
+                                   chunk_start, chunk_tokens)
+            chunk_start, chunk_tokens = None, 0
+            continue
+        if chunk_start is not None and chunk_tokens + unit_tokens > max_tokens:
+            yield chunk_start, chunk_end, chunk_tokens
+            chunk_start, chunk_tokens = None, 0
+        if chunk_start is None:
+            chunk_start = match.start()
+        chunk_end = match.end()
+        chunk_tokens += unit_tokens
+    if chunk_start is not None:
+        yield chunk_start, chunk_end, chunk_tokens
+
+def iter_resume_chunks(text: str, max_tokens: int = CHUNK_MAX_TOKENS, model: str = ""):
+    """Lazily split a resume into chunks that never cross a section header.
+
+    Sections are packed paragraph by paragraph, falling back to lines and then words
+    for oversized paragraphs, so each chunk stays within max_tokens (tiktoken counts
+    for model). Yields dicts with the chunk text, its [start, end) character offsets
+    in text, the section title and the token count; text[start:end] == chunk["text"].
+    """
+    text = safe_get_string(text)
+    for section, section_start, section_end in _iter_sections(text):
+        for start, end, tokens in _pack_spans(text, section_start, section_end, max_tokens, model):
+            # Trim surrounding whitespace while keeping offsets exact
+            chunk = text[start:end]
+            start += len(chunk) - len(chunk.lstrip())
+            end -= len(chunk) - len(chunk.rstrip())
+            if start < end:
+                yield {"text": text[start:end], "start": start, "end": end, "section": section, "tokens": tokens}
+
+def chunk_text(text: str, max_tokens: int = CHUNK_MAX_TOKENS, model: str = "") -> list:
+    """Split text into section-aware chunks of at most max_tokens tokens."""
+    return [chunk["text"] for chunk in iter_resume_chunks(text, max_tokens, model)]
 
 def parse_category_scores(text: str) -> dict:
     cats = {}
@@ -1061,64 +1531,264 @@ def safe_get_string(value, default=""):
         return default
     return str(value)
 
-def fetch_github_repositories_exclude_user(username: str) -> list:
-    """Fetch all repositories from a GitHub user excluding user-named repos."""
-    headers = {}
+# Common words ignored by keyword relevance scoring
+STOPWORDS = frozenset("""
+a an and are as at be been but by can for from has have if in into is it its of on or our
+such that the their them then there these they this to was we were will with you your
+about across all also any other over per should must more most well within who what which
+""".split())
+
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+def normalize_term(token: str):
+    """Return the term for a raw TERM_PATTERN match, or None for stopwords and single characters."""
+    term = token.rstrip(".")
+    return term if term not in STOPWORDS and len(term) > 1 else None
+
+# Bulk equivalent of TERM_PATTERN for ASCII bytes: term characters (and ROW_SEPARATOR) are kept and
+# everything else becomes a space, so bytes.split() yields each match with any leading "+#." attached
+ROW_SEPARATOR = "\x00"
+TERM_BYTES = bytes(byte if chr(byte) in "abcdefghijklmnopqrstuvwxyz0123456789+#.\x00" else ord(" ") for byte in range(256))
+
+def _join_rows(rows: list) -> str:
+    """Join rows into one string, with ROW_SEPARATOR as a standalone token between rows."""
+    joined = f" {ROW_SEPARATOR} ".join(rows)
+    if joined.count(ROW_SEPARATOR) != max(len(rows) - 1, 0):
+        joined = f" {ROW_SEPARATOR} ".join(row.replace(ROW_SEPARATOR, " ") for row in rows)
+    return joined
+
+def tokenize_terms(text: str) -> list:
+    """Lowercase text and split it into terms, keeping tech tokens such as c++, c# and node.js."""
+    terms = (normalize_term(token) for token in TERM_PATTERN.findall(safe_get_string(text).lower()))
+    return [term for term in terms if term]
+
+# GitHub API settings
+GITHUB_FETCH_CONCURRENCY = max(1, int(os.getenv("RESUMEMATCH_GITHUB_CONCURRENCY", "8")))
+GITHUB_REQUEST_TIMEOUT = float(os.getenv("RESUMEMATCH_GITHUB_TIMEOUT", "15"))
+
+@st.cache_resource(show_spinner=False)
+def get_github_session() -> requests.Session:
+    """Return the shared, connection-pooled session used for all GitHub API calls.
+
+    Held by Streamlit, so one session and its connection pool outlive each rerun.
+    """
+    session = requests.Session()
+    adapter = service_backends.github_adapter(pool_connections=4, pool_maxsize=GITHUB_FETCH_CONCURRENCY)
+    session.mount("https://", adapter)
+    session.headers['Accept'] = 'application/vnd.github+json'
     if GITHUB_TOKEN:
-        headers['Authorization'] = f'token {GITHUB_TOKEN}'
+        session.headers['Authorization'] = f'token {GITHUB_TOKEN}'
+    return session
+
+class GitHubRateLimit:
+    """Track GitHub rate-limit headers shared by concurrent requests."""
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = None
+        self._exhausted = False
+        self._lock = threading.Lock()
+
+    def update(self, response) -> None:
+        with self._lock:
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None and remaining.isdigit():
+                self.remaining = int(remaining)
+                metrics_exporter.GITHUB_RATE_LIMIT_REMAINING.set(self.remaining)
+            reset_at = response.headers.get('X-RateLimit-Reset')
+            if reset_at is not None and reset_at.isdigit():
+                self.reset_at = int(reset_at)
+                metrics_exporter.GITHUB_RATE_LIMIT_RESET.set(self.reset_at)
+
+            # Primary limit used up, or a secondary limit asking us to back off
+            if response.status_code in (403, 429) and (
+                self.remaining == 0 or 'Retry-After' in response.headers
+            ):
+                self._exhausted = True
+            elif self.remaining == 0:
+                self._exhausted = True
+
+    @property
+    def exhausted(self) -> bool:
+        with self._lock:
+            if self._exhausted and self.reset_at and time.time() >= self.reset_at:
+                self._exhausted = False
+            return self._exhausted
+
+GITHUB_CACHE_MAX_MB = float(os.getenv("RESUMEMATCH_GITHUB_CACHE_MAX_MB", "64"))
+
+# Validators and bodies for conditional GitHub requests; LRU-evicted, no TTL since
+# every hit is revalidated with the server
+github_http_cache = DiskCache(
+    os.path.join(CACHE_DIR, "github"),
+    max_bytes=int(GITHUB_CACHE_MAX_MB * 1024 * 1024)
+)
+
+def github_get(session: requests.Session, url: str, params=None) -> requests.Response:
+    """GET a GitHub API URL, revalidating cached responses with ETag/Last-Modified.
+
+    A 304 Not Modified is answered from the local cache and handed back as a regular
+    200 response, so callers never need to know whether the body came from disk.
+    """
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    token_id = hashlib.sha256(GITHUB_TOKEN.encode()).hexdigest()[:16] if GITHUB_TOKEN else ""
+    cache_key = github_http_cache.make_key({"url": full_url, "token": token_id})
+    cached = github_http_cache.get(cache_key)
     
-    try:
-        url = f"https://api.github.com/users/{username}/repos"
-        params = {
-            'sort': 'updated',
-            'direction': 'desc',
-            'per_page': 100,
-            'type': 'owner'
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        repos = response.json()
-        
-        filtered_repos = []
-        for repo in repos:
-            if not repo.get('fork', False):
-                if safe_get_string(repo.get('name', '')).lower() != username.lower():
-                    repo_data = {
-                        'name': safe_get_string(repo.get('name', '')),
-                        'description': safe_get_string(repo.get('description', '')),
-                        'html_url': safe_get_string(repo.get('html_url', '')),
-                        'language': safe_get_string(repo.get('language', '')),
-                        'languages_url': safe_get_string(repo.get('languages_url', '')),
-                        'stargazers_count': repo.get('stargazers_count', 0),
-                        'forks_count': repo.get('forks_count', 0),
-                        'created_at': safe_get_string(repo.get('created_at', '')),
-                        'updated_at': safe_get_string(repo.get('updated_at', '')),
-                        'topics': repo.get('topics', []) or [],
-                        'size': repo.get('size', 0)
-                    }
-                    
-                    try:
-                        if repo_data['languages_url']:
-                            lang_response = requests.get(repo_data['languages_url'], headers=headers)
-                            if lang_response.status_code == 200:
-                                languages_data = lang_response.json()
-                                repo_data['languages'] = [safe_get_string(lang) for lang in languages_data.keys() if lang]
-                            else:
-                                repo_data['languages'] = [repo_data['language']] if repo_data['language'] else []
-                        else:
-                            repo_data['languages'] = [repo_data['language']] if repo_data['language'] else []
-                    except:
-                        repo_data['languages'] = [repo_data['language']] if repo_data['language'] else []
-                    
-                    filtered_repos.append(repo_data)
-        
-        return filtered_repos
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
     
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching GitHub repositories: {str(e)}")
-        return []
+    start = time.perf_counter()
+    try:
+        response = session.get(full_url, headers=headers, timeout=GITHUB_REQUEST_TIMEOUT)
+    except requests.exceptions.RequestException:
+        metrics_exporter.record_github_request(full_url, "error", time.perf_counter() - start)
+        raise
+    metrics_exporter.record_github_request(full_url, response.status_code, time.perf_counter() - start)
+    
+    if response.status_code == 304 and cached:
+        cached_response = requests.Response()
+        cached_response.status_code = 200
+        cached_response.url = full_url
+        cached_response.request = response.request
+        cached_response.headers.update(response.headers)
+        cached_response.headers['Content-Type'] = cached.get('content_type') or 'application/json'
+        if cached.get('link'):
+            cached_response.headers['Link'] = cached['link']
+        cached_response._content = cached['body'].encode('utf-8')
+        cached_response.encoding = 'utf-8'
+        return cached_response
+    
+    if response.status_code == 200:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            try:
+                github_http_cache.set(cache_key, {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'link': response.headers.get('Link'),
+                    'content_type': response.headers.get('Content-Type'),
+                    'body': response.text
+                })
+            except Exception:
+                pass
+    
+    return response
+
+def _fallback_languages(repo_data: dict) -> list:
+    return [repo_data['language']] if repo_data['language'] else []
+
+@timed_span("github_languages_request")
+def fetch_repo_languages(session: requests.Session, repo_data: dict, rate_limit: GitHubRateLimit) -> tuple:
+    """Fetch the language breakdown for one repository, falling back to its primary language.
+
+    Returns (languages, complete); complete is False when the breakdown could not be
+    fetched (rate limit, network or API error) and only the primary language is known.
+    """
+    if not repo_data['languages_url']:
+        return _fallback_languages(repo_data), True
+    if rate_limit.exhausted:
+        return _fallback_languages(repo_data), False
+
+    try:
+        lang_response = github_get(session, repo_data['languages_url'])
+        rate_limit.update(lang_response)
+        if lang_response.status_code == 200:
+            languages_data = lang_response.json()
+            return [safe_get_string(lang) for lang in languages_data.keys() if lang], True
+    except Exception:
+        pass
+    return _fallback_languages(repo_data), False
+
+def _normalize_repo(repo: dict) -> dict:
+    """Reduce a GitHub API repository payload to the fields used for scoring."""
+    return {
+        'name': safe_get_string(repo.get('name', '')),
+        'description': safe_get_string(repo.get('description', '')),
+        'html_url': safe_get_string(repo.get('html_url', '')),
+        'language': safe_get_string(repo.get('language', '')),
+        'languages_url': safe_get_string(repo.get('languages_url', '')),
+        'stargazers_count': repo.get('stargazers_count', 0),
+        'forks_count': repo.get('forks_count', 0),
+        'created_at': safe_get_string(repo.get('created_at', '')),
+        'updated_at': safe_get_string(repo.get('updated_at', '')),
+        'pushed_at': safe_get_string(repo.get('pushed_at', '')),
+        'topics': repo.get('topics', []) or [],
+        'size': repo.get('size', 0)
+    }
+
+@timed_span("github_page_request")
+def _fetch_repo_page(session: requests.Session, url: str, params, username: str, rate_limit: GitHubRateLimit):
+    """Fetch one page of a user's repositories; return (filtered repos, next page URL)."""
+    response = github_get(session, url, params)
+    rate_limit.update(response)
+    response.raise_for_status()
+    
+    filtered_repos = []
+    for repo in response.json():
+        if not repo.get('fork', False):
+            if safe_get_string(repo.get('name', '')).lower() != username.lower():
+                filtered_repos.append(_normalize_repo(repo))
+    
+    next_url = response.links.get('next', {}).get('url')
+    return filtered_repos, next_url
+
+def _repo_unchanged(repo_data: dict, known_repo: dict) -> bool:
+    return (known_repo is not None
+            and known_repo.get('updated_at') == repo_data['updated_at']
+            and known_repo.get('pushed_at') == repo_data['pushed_at']
+            and 'languages' in known_repo
+            and not known_repo.get('languages_partial'))
+
+def iter_github_repositories(username: str, rate_limit: GitHubRateLimit = None, known_repos: dict = None):
+    """Yield a user's repositories (excluding forks and user-named repos) as each page arrives.
+
+    Pages are followed through the Link header. The next page is requested while the
+    languages calls for the current page are still in flight, so callers can start
+    scoring page 1 before the listing is complete. known_repos maps repo names to
+    previously stored records; repos whose updated_at and pushed_at are unchanged
+    reuse the stored languages instead of calling the languages endpoint, unless
+    those were only a fallback (languages_partial), which is fetched again.
+    """
+    known_repos = known_repos or {}
+    session = get_github_session()
+    rate_limit = rate_limit or GitHubRateLimit()
+    url = f"https://api.github.com/users/{username}/repos"
+    params = {
+        'sort': 'updated',
+        'direction': 'desc',
+        'per_page': 100,
+        'type': 'owner'
+    }
+    
+    # One extra worker so the page prefetch never waits behind languages calls
+    with make_thread_pool(GITHUB_FETCH_CONCURRENCY + 1) as executor:
+        page_future = executor.submit(_fetch_repo_page, session, url, params, username, rate_limit)
+        while page_future is not None:
+            filtered_repos, next_url = page_future.result()
+            
+            page_future = None
+            if next_url and not rate_limit.exhausted:
+                page_future = executor.submit(_fetch_repo_page, session, next_url, None, username, rate_limit)
+            
+            language_futures = [
+                None if _repo_unchanged(repo_data, known_repos.get(repo_data['name']))
+                else executor.submit(fetch_repo_languages, session, repo_data, rate_limit)
+                for repo_data in filtered_repos
+            ]
+            for repo_data, future in zip(filtered_repos, language_futures):
+                if future is None:
+                    repo_data['languages'] = known_repos[repo_data['name']]['languages']
+                else:
+                    repo_data['languages'], complete = future.result()
+                    if not complete:
+                        repo_data['languages_partial'] = True
+                yield repo_data
 
 def extract_github_username(github_url: str) -> str:
     """Extract username from GitHub URL."""
@@ -1180,79 +1850,339 @@ def extract_existing_projects_from_resume(resume_text: str) -> list:
     
     return existing_projects
 
-def compare_and_select_projects(repositories: list, existing_projects: list, job_description: str, model_choice: str, max_projects: int) -> list:
-    """Compare GitHub repos with existing resume projects and select the best ones based on job relevance only."""
-    
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def reduce_csr_rows(ufunc, indptr: np.ndarray, entry_values: np.ndarray) -> np.ndarray:
+    """Reduce per-entry values of a CSR matrix to one value per row with ufunc.reduceat."""
+    reduced = np.zeros((len(indptr) - 1,) + entry_values.shape[1:], dtype=entry_values.dtype)
+    # reduceat misreads empty rows, so only non-empty rows are reduced; the rest stay zero
+    non_empty = indptr[:-1] < indptr[1:]
+    if non_empty.any():
+        reduced[non_empty] = ufunc.reduceat(entry_values, indptr[:-1][non_empty], axis=0)
+    return reduced
+
+def bm25_weights(indices: np.ndarray, indptr: np.ndarray, term_counts: np.ndarray, vocabulary_size: int) -> np.ndarray:
+    """Per-entry BM25 weight of a CSR term-count matrix: idf(term) * saturated, length-normalised tf."""
+    if not len(term_counts):
+        return term_counts
+    doc_lengths = reduce_csr_rows(np.add, indptr, term_counts)
+    average_length = doc_lengths.mean() or 1.0
+    document_frequency = np.bincount(indices, minlength=vocabulary_size)
+    idf = np.log1p((len(indptr) - 1 - document_frequency + 0.5) / (document_frequency + 0.5))
+    entry_lengths = np.repeat(doc_lengths, np.diff(indptr))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * entry_lengths / average_length)
+    return idf[indices] * term_counts * (BM25_K1 + 1) / (term_counts + norm)
+
+class RepoTermIndex:
+    """Relevance index over a set of repositories, built once per fetch and scored with NumPy.
+
+    Repos are rows of sparse CSR matrices (indptr/indices) over a shared vocabulary:
+    BM25 term weights over name, description, topics and languages, plus the raw
+    name/description tokens used for substring matches and the repo-name words used
+    for duplicate detection. Every job-independent statistic is precomputed, so the
+    same index ranks thousands of repos against any job description in milliseconds.
+
+    A job keyword contains no whitespace, so it is a substring of a repo's name or
+    description exactly when it is a substring of one of those tokens; the substring
+    scan therefore runs once per keyword over the vocabulary instead of over every repo.
+    """
+
+    def __init__(self, repositories):
+        self.repos = list(repositories)
+        names, text_rows, bm25_rows = [], [], []
+        for repo in self.repos:
+            name = safe_get_string(repo.get('name', ''))
+            text = f"{name} {safe_get_string(repo.get('description', ''))}"
+            extra_values = [safe_get_string(value) for value in (repo.get('languages', []) or []) + (repo.get('topics', []) or []) if value]
+            names.append(name)
+            text_rows.append(text)
+            bm25_rows.append(" ".join([text, *extra_values]))
+
+        # Every field is tokenized in one C-level pass over all repos, joined by ROW_SEPARATOR
+        bm25_tokens = _join_rows(bm25_rows).lower().encode("ascii", "replace").translate(TERM_BYTES).split()
+        text_tokens = _join_rows(text_rows).lower().split()
+        name_word_tokens = _join_rows(names).lower().replace('-', ' ').replace('_', ' ').split()
+
+        self.vocabulary = {}
+        term_id = lambda term: self.vocabulary.setdefault(term, len(self.vocabulary))
+        # Raw tokens are normalized once per distinct token rather than once per occurrence
+        bm25_rows, raw_ids, raw_tokens = self._token_rows(bm25_tokens, ROW_SEPARATOR.encode())
+        terms = map(normalize_term, (token.decode("ascii").lstrip("+#.") for token in raw_tokens))
+        term_of_raw = np.array([-1 if term is None else term_id(term) for term in terms], dtype=np.int64)
+        text_rows, text_ids, text_keywords = self._token_rows(text_tokens, ROW_SEPARATOR)
+        term_of_text = np.array([-1] + [term_id(keyword) for keyword in text_keywords[1:]], dtype=np.int64)
+        name_word_rows, name_word_ids, name_words = self._token_rows(name_word_tokens, ROW_SEPARATOR)
+
+        # All vocabulary terms on one line each, so a substring scan is a single str.find loop
+        self.term_text = "\n".join(self.vocabulary)
+        self.term_starts = np.cumsum([0] + [len(term) + 1 for term in self.vocabulary])[:-1]
+        self.bm25_indices, self.bm25_indptr, bm25_counts = self._csr_rows(
+            len(self), bm25_rows, term_of_raw[raw_ids], len(self.vocabulary))
+        self.bm25_weights = bm25_weights(self.bm25_indices, self.bm25_indptr,
+                                         bm25_counts.astype(np.float64), len(self.vocabulary))
+        self.text_indices, self.text_indptr, _ = self._csr_rows(
+            len(self), text_rows, term_of_text[text_ids], len(self.vocabulary))
+        self.name_words = np.array(name_words[1:], dtype=str)
+        self.name_word_indices, self.name_word_indptr, _ = self._csr_rows(
+            len(self), name_word_rows, name_word_ids - 1, len(self.name_words))
+
+    @staticmethod
+    def _token_rows(tokens: list, separator):
+        """Return (row, id) arrays for the tokens of separator-joined rows, and the distinct tokens by id.
+
+        The separator takes id 0 and is dropped from the arrays.
+        """
+        distinct = defaultdict()
+        distinct.default_factory = distinct.__len__
+        distinct[separator]
+        ids = np.fromiter(map(distinct.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        is_separator = ids == 0
+        return np.cumsum(is_separator)[~is_separator], ids[~is_separator], list(distinct)
+
+    @staticmethod
+    def _csr_rows(row_count: int, rows: np.ndarray, column_ids: np.ndarray, column_count: int):
+        """Build (indices, indptr, counts) of a CSR matrix with one entry per distinct column per row.
+
+        Entries with a negative column id are dropped; counts holds how often each entry occurred.
+        """
+        column_count = max(column_count, 1)
+        keep = column_ids >= 0
+        keys, counts = np.unique(rows[keep] * column_count + column_ids[keep], return_counts=True)
+        indptr = np.zeros(row_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // column_count, minlength=row_count), out=indptr[1:])
+        return keys % column_count, indptr, counts
+
+    def __len__(self) -> int:
+        return len(self.repos)
+
+    def relevance_scores(self, job_terms: set) -> np.ndarray:
+        """BM25 score of each repo for the job description's terms."""
+        query = np.zeros(len(self.vocabulary))
+        query[[self.vocabulary[t] for t in job_terms if t in self.vocabulary]] = 1
+        return reduce_csr_rows(np.add, self.bm25_indptr, self.bm25_weights * query[self.bm25_indices])
+
+    def exact_match_scores(self, job_terms: set) -> np.ndarray:
+        """Two points per job term found as a substring of the repo name or description."""
+        if not job_terms or not self.vocabulary:
+            return np.zeros(len(self), dtype=np.int64)
+        term_hits = np.zeros((len(self.vocabulary), len(job_terms)), dtype=bool)
+        for column, term in enumerate(job_terms):
+            # Job terms never contain a newline, so every match lies inside one vocabulary term
+            positions = [match.start() for match in re.finditer(re.escape(term), self.term_text)]
+            term_hits[np.searchsorted(self.term_starts, positions, side="right") - 1, column] = True
+        repo_hits = reduce_csr_rows(np.logical_or, self.text_indptr, term_hits[self.text_indices])
+        return 2 * repo_hits.sum(axis=1)
+
+    def duplicate_penalties(self, existing_titles: list) -> np.ndarray:
+        """Five points per existing resume project whose title contains any repo name word."""
+        if not existing_titles or not len(self.name_words):
+            return np.zeros(len(self), dtype=np.int64)
+        word_hits = np.stack([np.char.find(title, self.name_words) >= 0 for title in existing_titles], axis=1)
+        repo_hits = reduce_csr_rows(np.logical_or, self.name_word_indptr, word_hits[self.name_word_indices])
+        return 5 * repo_hits.sum(axis=1)
+
+    def score(self, job_description: str, existing_titles: list) -> np.ndarray:
+        """Final score per repo: BM25 relevance + exact matches - duplicate penalty."""
+        if not len(self):
+            return np.zeros(0)
+        # Stopwords are dropped here, so "the" or "and" no longer earn points
+        job_terms = set(tokenize_terms(job_description))
+        return (self.relevance_scores(job_terms)
+                + self.exact_match_scores(job_terms)
+                - self.duplicate_penalties(existing_titles))
+
+@timed_span("project_selection")
+def compare_and_select_projects(repositories, existing_projects: list, job_description: str, model_choice: str, max_projects: int) -> list:
+    """Compare GitHub repos with existing resume projects and select the best ones based on job relevance only.
+
+    repositories may be a list, a RepoTermIndex, or a generator such as
+    refresh_github_repositories; streamed repos are indexed as they arrive
+    and all of them are scored in one vectorized pass once the stream ends.
+    """
     existing_titles = [safe_get_string(proj.get('title', '')).lower() for proj in existing_projects]
-    existing_keywords = set()
-    for proj in existing_projects:
-        title = safe_get_string(proj.get('title', ''))
-        description = safe_get_string(proj.get('description', ''))
-        existing_keywords.update(title.lower().split())
-        existing_keywords.update(description.lower().split())
-    
-    scored_repos = []
-    for repo in repositories:
-        repo_name = safe_get_string(repo.get('name', ''))
-        repo_name_lower = repo_name.lower().replace('-', ' ').replace('_', ' ')
-        
-        similarity_penalty = 0
-        for existing_title in existing_titles:
-            if any(word in existing_title for word in repo_name_lower.split() if word):
-                similarity_penalty += 5
-        
-        job_keywords = set(safe_get_string(job_description, '').lower().split())
-        repo_keywords = set()
-        
-        repo_keywords.update(repo_name.lower().split())
-        
-        repo_description = safe_get_string(repo.get('description', ''))
-        if repo_description:
-            repo_keywords.update(repo_description.lower().split())
-        
-        languages = repo.get('languages', []) or []
-        for lang in languages:
-            if lang:
-                repo_keywords.add(safe_get_string(lang).lower())
-        
-        topics = repo.get('topics', []) or []
-        for topic in topics:
-            if topic:
-                repo_keywords.add(safe_get_string(topic).lower())
-        
-        relevance_score = len(job_keywords.intersection(repo_keywords))
-        
-        exact_matches = 0
-        for keyword in job_keywords:
-            if keyword in repo_name.lower() or keyword in repo_description.lower():
-                exact_matches += 2
-        
-        final_score = relevance_score + exact_matches - similarity_penalty
-        
-        scored_repos.append((repo, final_score, relevance_score))
     
-    scored_repos.sort(key=lambda x: x[1], reverse=True)
-    selected_repos = [repo for repo, score, relevance in scored_repos[:max_projects]]
+    index = repositories if isinstance(repositories, RepoTermIndex) else RepoTermIndex(repositories)
+    final_scores = index.score(job_description, existing_titles)
     
-    return selected_repos
+    # A stable sort keeps fetch order among equally scored repos
+    ranking = np.argsort(-final_scores, kind="stable")[:max_projects]
+    return [index.repos[i] for i in ranking]
+
+GITHUB_INDEX_TTL_MINUTES = float(os.getenv("RESUMEMATCH_GITHUB_INDEX_TTL_MINUTES", "60"))
+
+class GitHubRepoStore:
+    """SQLite store of each user's normalized repositories, with a relevance index memo.
+
+    A user's repos are served from the store without any network call while the last
+    complete refresh is younger than ttl_seconds. Refreshes rewrite only the stored
+    records, and iter_github_repositories reuses stored languages for unchanged repos.
+    """
 
-def generate_project_descriptions_for_download(selected_projects: list, job_description: str, model_choice: str) -> str:
-    """Generate optimized project descriptions for download."""
+    def __init__(self, path: str, ttl_seconds: float, max_indexes: int = 16):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_indexes = max_indexes
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._schema_ready:
+            with connection:
+                connection.execute("""
+                    CREATE TABLE IF NOT EXISTS repositories (
+                        username TEXT NOT NULL,
+                        name TEXT NOT NULL,
+                        position INTEGER NOT NULL,
+                        updated_at TEXT,
+                        data TEXT NOT NULL,
+                        PRIMARY KEY (username, name)
+                    )""")
+                connection.execute("""
+                    CREATE TABLE IF NOT EXISTS users (
+                        username TEXT PRIMARY KEY,
+                        refreshed_at REAL NOT NULL
+                    )""")
+            self._schema_ready = True
+        return connection
+
+    def load(self, username: str) -> list:
+        """Return the stored repositories for username in GitHub listing order."""
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT data FROM repositories WHERE username = ? ORDER BY position",
+                (username.lower(),)
+            ).fetchall()
+        finally:
+            connection.close()
+        return [json.loads(data) for (data,) in rows]
+
+    def refreshed_at(self, username: str):
+        """Return the time of the last complete refresh for username, or None."""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT refreshed_at FROM users WHERE username = ?", (username.lower(),)
+            ).fetchone()
+        finally:
+            connection.close()
+        return row[0] if row else None
+
+    def is_fresh(self, username: str) -> bool:
+        refreshed_at = self.refreshed_at(username)
+        return refreshed_at is not None and time.time() - refreshed_at < self.ttl_seconds
+
+    def save(self, username: str, repositories: list, complete: bool) -> None:
+        """Upsert fetched repositories; a complete listing also drops repos no longer on GitHub."""
+        username = username.lower()
+        connection = self._connect()
+        try:
+            with connection:
+                if complete:
+                    # Replaced in the same transaction, so no per-repo bound parameters hit SQLite's variable limit
+                    connection.execute("DELETE FROM repositories WHERE username = ?", (username,))
+                connection.executemany(
+                    "INSERT OR REPLACE INTO repositories (username, name, position, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+                    [(username, repo['name'], position, repo.get('updated_at'), json.dumps(repo))
+                     for position, repo in enumerate(repositories)]
+                )
+                if complete:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO users (username, refreshed_at) VALUES (?, ?)",
+                        (username, time.time())
+                    )
+        finally:
+            connection.close()
+
+    def get_index(self, username: str) -> RepoTermIndex:
+        """Return the relevance index for the stored repos, rebuilt only after a refresh."""
+        refreshed_at = self.refreshed_at(username)
+        key = (username.lower(), refreshed_at)
+        with self._lock:
+            if key in self._indexes:
+                self._indexes.move_to_end(key)
+                return self._indexes[key]
+        index = RepoTermIndex(self.load(username))
+        self.remember_index(username, index, refreshed_at)
+        return index
+
+    def remember_index(
+        self, username: str, index: RepoTermIndex, refreshed_at: float = None
+    ) -> None:
+        """Memoize an index built while streaming a refresh.
+
+        Pass the ``refreshed_at`` the index was built against so a concurrent
+        refresh cannot pair it with a newer timestamp.
+        """
+        if refreshed_at is None:
+            refreshed_at = self.refreshed_at(username)
+        key = (username.lower(), refreshed_at)
+        with self._lock:
+            self._indexes[key] = index
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+
+@st.cache_resource(show_spinner=False)
+def _github_repo_store() -> GitHubRepoStore:
+    # Held by Streamlit so the index memo outlives each rerun of this script
+    return GitHubRepoStore(
+        os.path.join(CACHE_DIR, "github_repositories.sqlite3"),
+        ttl_seconds=GITHUB_INDEX_TTL_MINUTES * 60
+    )
+
+github_repo_store = _github_repo_store()
+
+def refresh_github_repositories(username: str):
+    """Stream a user's repositories from GitHub and record them in github_repo_store.
+
+    Only repos whose updated_at/pushed_at changed since the stored copy have their
+    languages refetched. The stored index is marked fresh only if the full listing
+    was received; partial results are still saved for the next incremental refresh.
+    """
+    rate_limit = GitHubRateLimit()
+    known_repos = {repo['name']: repo for repo in github_repo_store.load(username)}
+    repositories = []
+    complete = False
     
-    descriptions_text = "SELECTED GITHUB PROJECTS - OPTIMIZED FOR JOB APPLICATION\n"
-    descriptions_text += "=" * 60 + "\n"
-    descriptions_text += f"Selection Criteria: Job Relevance Only (No GitHub Stars Considered)\n"
-    descriptions_text += "=" * 60 + "\n\n"
+    # A span inside the generator, since decorating it would only time its creation
+    try:
+        with timed_span("github_fetch"):
+            for repo_data in iter_github_repositories(username, rate_limit, known_repos):
+                repositories.append(repo_data)
+                yield repo_data
+        complete = not rate_limit.exhausted
+    except requests.exceptions.RequestException as e:
+        st.error(f"Error fetching GitHub repositories: {str(e)}")
     
-    for i, project in enumerate(selected_projects, 1):
-        project_name = safe_get_string(project.get('name', f'Project_{i}'))
-        title = project_name.replace('-', ' ').replace('_', ' ').title()
-        
-        project_description = safe_get_string(project.get('description', 'No description'))
-        languages = project.get('languages', []) or []
-        topics = project.get('topics', []) or []
-        
-        description_prompt = f"""
+    if rate_limit.exhausted:
+        st.warning("GitHub rate limit reached - repository list or language details may be incomplete.")
+    
+    if repositories or complete:
+        try:
+            github_repo_store.save(username, repositories, complete)
+        except sqlite3.Error as e:
+            st.warning(f"Could not save GitHub repositories to the local index: {str(e)}")
+
+# Bounded concurrency and per-call timeout for the per-project LLM calls
+LLM_CONCURRENCY = max(1, int(os.getenv("RESUMEMATCH_LLM_CONCURRENCY", "4")))
+LLM_CALL_TIMEOUT = float(os.getenv("RESUMEMATCH_LLM_TIMEOUT", "60"))
+
+def generate_project_description(project: dict, i: int, job_description: str, model_choice: str, llm_client=None) -> str:
+    """Generate the optimized description block for one project, falling back to a template on failure."""
+    llm_client = llm_client or client
+    project_name = safe_get_string(project.get('name', f'Project_{i}'))
+    title = project_name.replace('-', ' ').replace('_', ' ').title()
+    
+    project_description = safe_get_string(project.get('description', 'No description'))
+    languages = project.get('languages', []) or []
+    topics = project.get('topics', []) or []
+    
+    description_prompt = f"""
         You are a professional resume writer. Create a compelling, ATS-optimized project description for this GitHub project that aligns with the job requirements.
         
         Job Description:
@@ -1279,55 +2209,85 @@ def generate_project_descriptions_for_download(selected_projects: list, job_desc
         • [Third bullet point if needed]
         TECHNOLOGIES: [Comma-separated list of technologies]
         """
-        
-        try:
-            mt, temp, tp = get_deterministic_params(description_prompt, job_description, model_choice)
-            
-            messages = [
-                {"role": "system", "content": "You are a professional resume writer. Create compelling project descriptions that match job requirements."},
-                {"role": "user", "content": description_prompt}
-            ]
-            
-            response = make_api_call_with_reproducibility(
-                client, model_choice, messages, mt, temp, tp
-            )
-            
-            if response:
-                content = response.choices[0].message.content.strip()
-                
-                title_match = re.search(r'TITLE:\s*(.+)', content, re.IGNORECASE)
-                desc_match = re.search(r'DESCRIPTION:\s*(.*?)(?=TECHNOLOGIES:|$)', content, re.IGNORECASE | re.DOTALL)
-                tech_match = re.search(r'TECHNOLOGIES:\s*(.+)', content, re.IGNORECASE)
-                
-                if title_match:
-                    title = title_match.group(1).strip()
-                
-                if desc_match:
-                    description = desc_match.group(1).strip()
-                else:
-                    description = f"• Developed {project_description if project_description != 'No description' else 'a comprehensive software project showcasing technical skills'}\n• Implemented using {', '.join([safe_get_string(lang) for lang in languages if lang]) or 'modern technologies'}\n• Demonstrates proficiency in software development and problem-solving"
-                
-                if tech_match:
-                    technologies = tech_match.group(1).strip()
-                else:
-                    technologies = ', '.join([safe_get_string(lang) for lang in languages if lang]) or 'Python, JavaScript'
-                
+    
+    try:
+        mt, temp, tp = get_deterministic_params(description_prompt, job_description, model_choice, "project_description")
+    
+        messages = [
+            {"role": "system", "content": "You are a professional resume writer. Create compelling project descriptions that match job requirements."},
+            {"role": "user", "content": description_prompt}
+        ]
+    
+        response = make_api_call_with_reproducibility(
+            llm_client, model_choice, messages, mt, temp, tp, analysis_type="project_description"
+        )
+    
+        if response:
+            content = response.choices[0].message.content.strip()
+    
+            title_match = re.search(r'TITLE:\s*(.+)', content, re.IGNORECASE)
+            desc_match = re.search(r'DESCRIPTION:\s*(.*?)(?=TECHNOLOGIES:|$)', content, re.IGNORECASE | re.DOTALL)
+            tech_match = re.search(r'TECHNOLOGIES:\s*(.+)', content, re.IGNORECASE)
+    
+            if title_match:
+                title = title_match.group(1).strip()
+    
+            if desc_match:
+                description = desc_match.group(1).strip()
             else:
                 description = f"• Developed {project_description if project_description != 'No description' else 'a comprehensive software project showcasing technical skills'}\n• Implemented using {', '.join([safe_get_string(lang) for lang in languages if lang]) or 'modern technologies'}\n• Demonstrates proficiency in software development and problem-solving"
+    
+            if tech_match:
+                technologies = tech_match.group(1).strip()
+            else:
                 technologies = ', '.join([safe_get_string(lang) for lang in languages if lang]) or 'Python, JavaScript'
-        
-        except Exception as e:
+    
+        else:
             description = f"• Developed {project_description if project_description != 'No description' else 'a comprehensive software project showcasing technical skills'}\n• Implemented using {', '.join([safe_get_string(lang) for lang in languages if lang]) or 'modern technologies'}\n• Demonstrates proficiency in software development and problem-solving"
             technologies = ', '.join([safe_get_string(lang) for lang in languages if lang]) or 'Python, JavaScript'
-        
-        # Add to descriptions text
-        descriptions_text += f"PROJECT {i}: {title}\n"
-        descriptions_text += f"GitHub: {safe_get_string(project.get('html_url', ''))}\n"
-        descriptions_text += f"Languages: {', '.join([safe_get_string(lang) for lang in languages if lang])}\n"
-        descriptions_text += f"Topics: {', '.join([safe_get_string(topic) for topic in topics if topic])}\n\n"
-        descriptions_text += f"{description}\n\n"
-        descriptions_text += f"Technologies: {technologies}\n"
-        descriptions_text += "-" * 50 + "\n\n"
+    
+    except Exception as e:
+        description = f"• Developed {project_description if project_description != 'No description' else 'a comprehensive software project showcasing technical skills'}\n• Implemented using {', '.join([safe_get_string(lang) for lang in languages if lang]) or 'modern technologies'}\n• Demonstrates proficiency in software development and problem-solving"
+        technologies = ', '.join([safe_get_string(lang) for lang in languages if lang]) or 'Python, JavaScript'
+    
+    # Add to descriptions text
+    project_text = f"PROJECT {i}: {title}\n"
+    project_text += f"GitHub: {safe_get_string(project.get('html_url', ''))}\n"
+    project_text += f"Languages: {', '.join([safe_get_string(lang) for lang in languages if lang])}\n"
+    project_text += f"Topics: {', '.join([safe_get_string(topic) for topic in topics if topic])}\n\n"
+    project_text += f"{description}\n\n"
+    project_text += f"Technologies: {technologies}\n"
+    project_text += "-" * 50 + "\n\n"
+    
+    return project_text
+
+def generate_project_descriptions_for_download(selected_projects: list, job_description: str, model_choice: str, progress_callback=None) -> str:
+    """Generate optimized project descriptions for download.
+
+    Projects are described concurrently (at most RESUMEMATCH_LLM_CONCURRENCY calls in
+    flight, each bounded by RESUMEMATCH_LLM_TIMEOUT) and assembled in selection order.
+    progress_callback(completed, total) is called as each description finishes.
+    """
+    
+    descriptions_text = "SELECTED GITHUB PROJECTS - OPTIMIZED FOR JOB APPLICATION\n"
+    descriptions_text += "=" * 60 + "\n"
+    descriptions_text += f"Selection Criteria: Job Relevance Only (No GitHub Stars Considered)\n"
+    descriptions_text += "=" * 60 + "\n\n"
+    
+    project_texts = [""] * len(selected_projects)
+    if selected_projects:
+        llm_client = client.with_options(timeout=LLM_CALL_TIMEOUT)
+        with make_thread_pool(min(LLM_CONCURRENCY, len(selected_projects))) as executor:
+            futures = {
+                executor.submit(generate_project_description, project, i, job_description, model_choice, llm_client): i
+                for i, project in enumerate(selected_projects, 1)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                project_texts[futures[future] - 1] = future.result()
+                if progress_callback:
+                    progress_callback(completed, len(selected_projects))
+    
+    descriptions_text += "".join(project_texts)
     
     descriptions_text += f"\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
     descriptions_text += "Selection Method: Job Relevance Matching Only\n"
@@ -1335,8 +2295,35 @@ def generate_project_descriptions_for_download(selected_projects: list, job_desc
     
     return descriptions_text
 
-def make_api_call_with_reproducibility(client, model_choice, messages, max_tokens, temperature, top_p):
-    """Make API call with reproducibility parameters."""
+def llm_cache_key(model_choice, messages, max_tokens, temperature, top_p) -> str:
+    return llm_cache.make_key({
+        "model": model_choice,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "top_p": top_p
+    })
+
+@timed_span("llm_call")
+def make_api_call_with_reproducibility(client, model_choice, messages, max_tokens, temperature, top_p, analysis_type: str = "other",
+                                      raise_errors: bool = False):
+    """Make API call with reproducibility parameters, serving repeats from the response cache.
+
+    analysis_type only labels the call in the exported metrics. A failed call is shown
+    with st.error and returns None, or is re-raised with raise_errors (headless callers,
+    where st.error is a no-op).
+    """
+    cache_key = llm_cache_key(model_choice, messages, max_tokens, temperature, top_p)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        try:
+            response = ChatCompletion.model_validate(cached)
+            metrics_exporter.record_llm_call(model_choice, analysis_type, "cache_hit")
+            return response
+        except Exception:
+            pass
+
+    start = time.perf_counter()
     try:
         response = client.chat.completions.create(
             model=model_choice,
@@ -1345,37 +2332,548 @@ def make_api_call_with_reproducibility(client, model_choice, messages, max_token
             temperature=temperature,
             top_p=top_p
         )
-        return response
     except Exception as e:
+        metrics_exporter.record_llm_call(model_choice, analysis_type, "error", time.perf_counter() - start)
+        if raise_errors:
+            raise
         st.error(f"API call failed: {str(e)}")
         return None
+    metrics_exporter.record_llm_call(model_choice, analysis_type, "success", time.perf_counter() - start, response.usage)
+
+    try:
+        llm_cache.set(cache_key, response.model_dump(mode="json"))
+    except Exception:
+        # A cache write failure should never fail the analysis itself
+        pass
+    return response
+
+def stream_api_call_with_reproducibility(client, model_choice, messages, max_tokens, temperature, top_p, metrics: dict = None,
+                                        analysis_type: str = "other"):
+    """Streaming variant of make_api_call_with_reproducibility that yields text deltas as they arrive.
+
+    A cached response is yielded whole. A completed stream is stored in the same cache
+    entry as the non-streaming call, so either path serves the other's repeats; a
+    stream that fails midway is reported and not cached. metrics, if given, receives
+    time_to_first_token and total_time in seconds and whether the response was cached.
+    """
+    metrics = metrics if metrics is not None else {}
+    start = time.perf_counter()
+    cache_key = llm_cache_key(model_choice, messages, max_tokens, temperature, top_p)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        try:
+            text = ChatCompletion.model_validate(cached).choices[0].message.content
+            metrics.update(cached=True, time_to_first_token=time.perf_counter() - start,
+                           total_time=time.perf_counter() - start)
+            get_span_timings().record("llm_stream", metrics["total_time"])
+            metrics_exporter.record_llm_call(model_choice, analysis_type, "cache_hit")
+            yield text
+            return
+        except Exception:
+            pass
+
+    parts = []
+    finish_reason = None
+    response_id = ""
+    try:
+        stream = client.chat.completions.create(
+            model=model_choice,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stream=True
+        )
+        for chunk in stream:
+            response_id = chunk.id or response_id
+            if not chunk.choices:
+                continue
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if not parts:
+                    metrics["time_to_first_token"] = time.perf_counter() - start
+                parts.append(delta)
+                yield delta
+    except Exception as e:
+        metrics_exporter.record_llm_call(model_choice, analysis_type, "error", time.perf_counter() - start)
+        st.error(f"API call failed: {str(e)}")
+        return
+    metrics.update(cached=False, total_time=time.perf_counter() - start)
+    if not parts:
+        metrics_exporter.record_llm_call(model_choice, analysis_type, "error", metrics["total_time"])
+        return
+    metrics_exporter.record_llm_call(model_choice, analysis_type, "success", metrics["total_time"])
+    metrics_exporter.LLM_FIRST_TOKEN.observe(metrics["time_to_first_token"], model=model_choice, analysis_type=analysis_type)
+    get_span_timings().record("llm_stream_first_token", metrics["time_to_first_token"])
+    get_span_timings().record("llm_stream", metrics["total_time"])
+
+    try:
+        llm_cache.set(cache_key, {
+            "id": response_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model_choice,
+            "choices": [{
+                "index": 0,
+                "finish_reason": finish_reason or "stop",
+                "message": {"role": "assistant", "content": "".join(parts)}
+            }]
+        })
+    except Exception:
+        # A cache write failure should never fail the analysis itself
+        pass
+
+def make_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Create a thread pool whose workers share the current Streamlit script context."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    
+    def attach_context():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+    
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=attach_context)
+
+# Analysis prompts shared by the individual buttons and the full-analysis mode
+PROFILE_FIT_PROMPT = (
+    "You are an expert Technical HR Manager with deep industry knowledge. "
+    "Conduct a comprehensive evaluation of this candidate's profile against the job description. "
+    "Provide your analysis in exactly this format:\n\n"
+    "**FIT SCORE: [X]%**\n\n"
+    "**TOP 3 STRENGTHS:**\n"
+    "1. [Specific strength with concrete example from resume]\n"
+    "2. [Specific strength with concrete example from resume]\n"
+    "3. [Specific strength with concrete example from resume]\n\n"
+    "**TOP 3 IMPROVEMENT AREAS:**\n"
+    "1. [Specific gap with actionable improvement suggestion]\n"
+    "2. [Specific gap with actionable improvement suggestion]\n"
+    "3. [Specific gap with actionable improvement suggestion]\n\n"
+    "**RECOMMENDATION:**\n"
+    "[Overall hiring recommendation with reasoning]\n\n"
+    "Be specific, reference exact details from the resume, and provide actionable insights."
+)
+
+KEYWORD_MATCH_PROMPT = (
+    "You are an ATS optimization expert and keyword strategist. "
+    "Conduct a comprehensive keyword analysis between the resume and job description. "
+    "Provide your analysis in exactly this format:\n\n"
+    "**KEYWORD MATCH PERCENTAGE: [X]%**\n\n"
+    "**10 CRITICAL MISSING KEYWORDS:**\n"
+    "1. [high-impact keyword]\n2. [high-impact keyword]\n3. [high-impact keyword]\n"
+    "4. [high-impact keyword]\n5. [high-impact keyword]\n6. [high-impact keyword]\n"
+    "7. [high-impact keyword]\n8. [high-impact keyword]\n9. [high-impact keyword]\n10. [high-impact keyword]\n\n"
+    "**ATS OPTIMIZATION RECOMMENDATIONS:**\n"
+    "• [Specific integration strategy 1]\n"
+    "• [Specific integration strategy 2]\n"
+    "• [Specific integration strategy 3]\n"
+    "• [Specific integration strategy 4]\n\n"
+    "**INDUSTRY-SPECIFIC INSIGHTS:**\n"
+    "[Provide industry context and additional recommendations]"
+)
+
+CATEGORY_SCORES_PROMPT = (
+    "You are an expert ATS analyst and recruitment specialist. "
+    "Score the candidate (0–100) in each category based on job alignment. "
+    "Return ONLY a valid JSON object with this exact format:\n"
+    "{\n"
+    '  "skills": [score 0-100],\n'
+    '  "experience": [score 0-100],\n'
+    '  "education": [score 0-100],\n'
+    '  "keywords": [score 0-100],\n'
+    '  "certifications": [score 0-100]\n'
+    "}\n"
+    "Provide only the JSON object without any additional text or explanation."
+)
+
+QA_SYSTEM_PROMPT = (
+    "You are an expert HR consultant and career advisor. Provide detailed, actionable insights "
+    "based on the resume content and job requirements. Be specific and reference exact details from the resume."
+)
+
+ANALYSIS_PROMPTS = {
+    "profile_fit": PROFILE_FIT_PROMPT,
+    "keyword_match": KEYWORD_MATCH_PROMPT,
+    "category_scores": CATEGORY_SCORES_PROMPT,
+    "qa": QA_SYSTEM_PROMPT
+}
+
+ANALYSIS_LABELS = {
+    "profile_fit": "🎯 Profile Fit",
+    "keyword_match": "🔍 Keyword Match",
+    "category_scores": "📊 Category Scores",
+    "qa": "💬 AI Consultant"
+}
+
+# Q&A context retrieval settings
+QA_CHUNK_TOKENS = int(os.getenv("RESUMEMATCH_QA_CHUNK_TOKENS", "300"))
+QA_TOP_K_CHUNKS = int(os.getenv("RESUMEMATCH_QA_TOP_K_CHUNKS", "5"))
+QA_CONTEXT_MAX_TOKENS = int(os.getenv("RESUMEMATCH_QA_CONTEXT_MAX_TOKENS", "1500"))
+# Distinct resumes whose chunk index is kept in memory
+QA_INDEX_MEMO_ENTRIES = int(os.getenv("RESUMEMATCH_QA_INDEX_MEMO_ENTRIES", "16"))
+# Job description terms break ties for generic questions such as "How can I improve my resume?"
+QA_JOB_TERM_WEIGHT = 0.3
+
+class ResumeChunkIndex:
+    """BM25 index over section-aware resume chunks for picking Q&A context."""
+
+    def __init__(self, resume_text: str, max_tokens: int = QA_CHUNK_TOKENS):
+        self.chunks = list(iter_resume_chunks(resume_text, max_tokens))
+        self.vocabulary = defaultdict()
+        self.vocabulary.default_factory = self.vocabulary.__len__
+        indices, counts, indptr = [], [], [0]
+        for chunk in self.chunks:
+            # The section title is indexed too, so "education" finds the Education section
+            term_counts = Counter(tokenize_terms(f"{chunk['section']} {chunk['text']}"))
+            indices.extend(map(self.vocabulary.__getitem__, term_counts))
+            counts.extend(term_counts.values())
+            indptr.append(len(indices))
+        self.vocabulary.default_factory = None
+        self.indices = np.array(indices, dtype=np.int64)
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.weights = bm25_weights(self.indices, self.indptr, np.array(counts, dtype=np.float64), len(self.vocabulary))
+
+    def scores(self, question: str, job_desc: str = "") -> np.ndarray:
+        """BM25 score of every chunk for the question, with job description terms at lower weight."""
+        query = np.zeros(len(self.vocabulary))
+        for terms, weight in ((tokenize_terms(job_desc), QA_JOB_TERM_WEIGHT), (tokenize_terms(question), 1.0)):
+            term_ids = [self.vocabulary[t] for t in set(terms) if t in self.vocabulary]
+            query[term_ids] = np.maximum(query[term_ids], weight)
+        return reduce_csr_rows(np.add, self.indptr, self.weights * query[self.indices])
+
+    def top_chunks(self, question: str, job_desc: str = "", k: int = QA_TOP_K_CHUNKS,
+                   max_tokens: int = QA_CONTEXT_MAX_TOKENS) -> list:
+        """Return up to k best-matching chunks within max_tokens, in resume order."""
+        if not self.chunks:
+            return []
+        # Stable sort keeps resume order among ties, so a question with no matching
+        # terms falls back to the opening chunks as before
+        ranking = np.argsort(-self.scores(question, job_desc), kind="stable")
+        selected, used_tokens = [], 0
+        for i in ranking[:k]:
+            chunk = self.chunks[i]
+            if selected and used_tokens + chunk["tokens"] > max_tokens:
+                continue
+            selected.append(chunk)
+            used_tokens += chunk["tokens"]
+        return sorted(selected, key=lambda chunk: chunk["start"])
+
+@st.cache_resource(show_spinner=False)
+def _resume_chunk_index_memo():
+    # Held by Streamlit rather than this module, which is re-executed on every rerun
+    return OrderedDict(), threading.Lock()
+
+_resume_chunk_indexes, _resume_chunk_indexes_lock = _resume_chunk_index_memo()
+
+def get_resume_chunk_index(resume_text: str) -> ResumeChunkIndex:
+    """Return the chunk index for a resume, built once per distinct resume text."""
+    key = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    with _resume_chunk_indexes_lock:
+        if key in _resume_chunk_indexes:
+            _resume_chunk_indexes.move_to_end(key)
+            return _resume_chunk_indexes[key]
+    index = ResumeChunkIndex(resume_text)
+    with _resume_chunk_indexes_lock:
+        _resume_chunk_indexes[key] = index
+        while len(_resume_chunk_indexes) > QA_INDEX_MEMO_ENTRIES:
+            _resume_chunk_indexes.popitem(last=False)
+    return index
+
+def build_analysis_messages(analysis_type: str, job_desc: str, resume_text: str, question: str = "") -> list:
+    """Build the chat messages for one analysis type."""
+    if analysis_type == "qa":
+        chunks = get_resume_chunk_index(resume_text).top_chunks(question, job_desc)
+        context = "\n\n".join(f"[{chunk['section']}]\n{chunk['text']}" for chunk in chunks)
+        user_content = f"Job Description:\n{job_desc}\n\nResume Content:\n{context}\n\nQuestion: {question}"
+    else:
+        user_content = f"Job Description:\n{job_desc}\n\nResume Text:\n{resume_text}"
+    
+    return [
+        {"role": "system", "content": ANALYSIS_PROMPTS[analysis_type]},
+        {"role": "user", "content": user_content}
+    ]
+
+# Map-reduce settings for resumes that do not fit one prompt
+MAP_REDUCE_MAX_ROUNDS = 3
+
+RESUME_SECTION_SUMMARY_PROMPT = (
+    "You are an expert technical recruiter. You will receive the job description and ONE section "
+    "of a longer resume. Extract every detail from this section that is relevant to evaluating the "
+    "candidate for the job: skills and technologies, roles with employers, dates and durations, "
+    "measurable achievements, projects, education, and certifications. Keep exact names, numbers "
+    "and keywords as written. Return concise bullet points only, with no commentary or scoring."
+)
+
+def messages_token_count(messages: list, model: str) -> int:
+    """Approximate prompt size of a chat request, including per-message overhead."""
+    return sum(count_tokens(message["content"], model) + 4 for message in messages)
+
+def analysis_fits_context(messages: list, model: str, analysis_type: str) -> bool:
+    """Check that a request leaves room for its output budget within the model's context window."""
+    return messages_token_count(messages, model) + get_output_token_budget(analysis_type, model) <= get_context_window(model)
+
+def summarize_resume_section(job_desc: str, section: str, model_choice: str):
+    """Map step: condense one resume chunk to the evidence relevant to the job."""
+    msgs = [
+        {"role": "system", "content": RESUME_SECTION_SUMMARY_PROMPT},
+        {"role": "user", "content": f"Job Description:\n{job_desc}\n\nResume Section:\n{section}"}
+    ]
+    mt, temp, tp = get_deterministic_params(RESUME_SECTION_SUMMARY_PROMPT, job_desc, model_choice, "section_summary",
+                                            extra_tokens=count_tokens(section, model_choice))
+    r = make_api_call_with_reproducibility(client, model_choice, msgs, mt, temp, tp, analysis_type="section_summary")
+    if r:
+        return r.choices[0].message.content
+    return None
+
+def condense_resume(job_desc: str, resume_text: str, model_choice: str, analysis_type: str):
+    """Shrink a resume that overflows the model's context with a parallel map-reduce.
+
+    The resume is cut into section-aware chunks sized to the model's remaining token budget, each
+    chunk is summarized against the job description in parallel (map), and the
+    summaries are joined in resume order (reduce). Rounds repeat until the analysis
+    prompt fits. Returns the condensed text, or None if every summary call failed.
+    """
+    for _ in range(MAP_REDUCE_MAX_ROUNDS):
+        msgs = build_analysis_messages(analysis_type, job_desc, resume_text)
+        if analysis_fits_context(msgs, model_choice, analysis_type):
+            return resume_text
+        
+        overhead = count_tokens(RESUME_SECTION_SUMMARY_PROMPT + job_desc, model_choice, memoize=True) + 50
+        chunk_budget = get_context_window(model_choice) - overhead - get_output_token_budget("section_summary", model_choice) - 200
+        if chunk_budget < 256:
+            # The job description alone nearly fills the window; nothing left to split into
+            return resume_text
+        
+        chunks = chunk_text(resume_text, chunk_budget, model_choice)
+        
+        with make_thread_pool(min(LLM_CONCURRENCY, len(chunks))) as executor:
+            summaries = list(executor.map(
+                lambda chunk: summarize_resume_section(job_desc, chunk, model_choice), chunks
+            ))
+        
+        summaries = [summary for summary in summaries if summary]
+        if not summaries:
+            return None
+        resume_text = "\n\n".join(f"[Resume part {i}]\n{summary}" for i, summary in enumerate(summaries, 1))
+    return resume_text
+
+@timed_span("resume_condense")
+def condense_resume_for_analyses(job_desc: str, resume_text: str, model_choice: str, analysis_types: list):
+    """Return resume_text condensed just enough to fit every analysis in analysis_types, or None.
+
+    Analyses needing the largest output budget are checked first, so one map-reduce
+    usually covers the rest. Q&A is skipped: it retrieves chunks instead.
+    """
+    analysis_types = sorted((t for t in analysis_types if t != "qa"),
+                            key=lambda t: get_output_token_budget(t, model_choice), reverse=True)
+    for analysis_type in analysis_types:
+        msgs = build_analysis_messages(analysis_type, job_desc, resume_text)
+        if not analysis_fits_context(msgs, model_choice, analysis_type):
+            resume_text = condense_resume(job_desc, resume_text, model_choice, analysis_type)
+            if resume_text is None:
+                return None
+    return resume_text
+
+def prepare_analysis_request(analysis_type: str, job_desc: str, resume_text: str, model_choice: str, question: str = ""):
+    """Build (messages, max_tokens, temperature, top_p) for one analysis, or None if it cannot run.
+
+    Resumes too long for the model's context window are condensed with condense_resume
+    first, so long CVs neither fail at the API nor get truncated silently.
+    """
+    resume_text = condense_resume_for_analyses(job_desc, resume_text, model_choice, [analysis_type])
+    if resume_text is None:
+        return None
+    
+    with timed_span("prompt_building"):
+        budget_text = job_desc + question if analysis_type == "qa" else job_desc
+        msgs = build_analysis_messages(analysis_type, job_desc, resume_text, question)
+        resume_tokens = messages_token_count(msgs, model_choice) - count_tokens(budget_text, model_choice, memoize=True)
+        mt, temp, tp = get_deterministic_params("", budget_text, model_choice, analysis_type, extra_tokens=resume_tokens)
+    return msgs, mt, temp, tp
+
+def run_analysis(analysis_type: str, job_desc: str, resume_text: str, model_choice: str, question: str = "",
+                 raise_errors: bool = False):
+    """Run one analysis against the selected model and return the response text, or None on failure.
+
+    With raise_errors the API exception propagates instead of being shown with st.error.
+    """
+    request = prepare_analysis_request(analysis_type, job_desc, resume_text, model_choice, question)
+    if request is None:
+        return None
+    
+    r = make_api_call_with_reproducibility(client, model_choice, *request, analysis_type=analysis_type,
+                                           raise_errors=raise_errors)
+    if r:
+        return r.choices[0].message.content
+    return None
+
+def stream_analysis(analysis_type: str, job_desc: str, resume_text: str, model_choice: str, question: str = "", metrics: dict = None):
+    """Run one analysis and yield its response text incrementally, for st.write_stream."""
+    request = prepare_analysis_request(analysis_type, job_desc, resume_text, model_choice, question)
+    if request is None:
+        return
+    yield from stream_api_call_with_reproducibility(client, model_choice, *request, metrics=metrics, analysis_type=analysis_type)
+
+def parse_category_response(raw: str) -> dict:
+    """Parse the category-score JSON, falling back to regex extraction."""
+    try:
+        json_match = re.search(r'\{.*\}', raw, re.DOTALL)
+        if json_match:
+            json_str = json_match.group()
+            data = json.loads(json_str)
+            return {k.title(): data.get(k, 0) for k in
+                    ["skills", "experience", "education", "keywords", "certifications"]}
+        raise json.JSONDecodeError("No JSON found", raw, 0)
+    except json.JSONDecodeError:
+        return parse_category_scores(raw)
+
+def summarize_category_scores(cats: dict) -> dict:
+    """Compute the weighted selection percentage and strength/growth split for category scores."""
+    sel_pct = weighted_score(cats)
+    return {
+        "categories": cats,
+        "selection_percentage": sel_pct,
+        "positive_categories": [c for c, s in cats.items() if s >= sel_pct],
+        "negative_categories": [c for c, s in cats.items() if s < sel_pct]
+    }
+
+def apply_analysis_result(report: dict, analysis_type: str, text: str) -> None:
+    """Store one analysis result in the session report."""
+    if analysis_type == "category_scores":
+        report.update(summarize_category_scores(parse_category_response(text)))
+    elif analysis_type == "qa":
+        report["qa_answer"] = text
+    else:
+        report[analysis_type] = text
+
+def run_full_analysis(job_desc: str, resume_text: str, model_choice: str, question: str = ""):
+    """Dispatch every analysis concurrently and yield (analysis_type, text) as each one finishes."""
+    analysis_types = ["profile_fit", "keyword_match", "category_scores"]
+    if question:
+        analysis_types.append("qa")
+    
+    # Condensed once up front: per analysis, identical map calls would run concurrently
+    condensed_text = condense_resume_for_analyses(job_desc, resume_text, model_choice, analysis_types)
+    if condensed_text is None:
+        for analysis_type in analysis_types:
+            yield analysis_type, None
+        return
+    
+    with make_thread_pool(len(analysis_types)) as executor:
+        futures = {
+            # Q&A retrieves its context from the full resume
+            executor.submit(run_analysis, analysis_type, job_desc,
+                            resume_text if analysis_type == "qa" else condensed_text,
+                            model_choice, question): analysis_type
+            for analysis_type in analysis_types
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+# Multi-posting ranking: a local prefilter decides which postings reach the LLM
+MULTI_JOB_TOP_K = max(1, int(os.getenv("RESUMEMATCH_MULTI_JOB_TOP_K", "10")))
+
+def split_job_descriptions(text: str) -> list:
+    """Split pasted postings separated by lines containing only ---."""
+    postings = re.split(r"^\s*-{3,}\s*$", safe_get_string(text), flags=re.MULTILINE)
+    return [posting.strip() for posting in postings if posting.strip()]
+
+def job_title(job_desc: str, max_chars: int = 80) -> str:
+    """Use the first non-empty line of a posting as its display title."""
+    first_line = next((line.strip() for line in job_desc.splitlines() if line.strip()), "Untitled posting")
+    return first_line if len(first_line) <= max_chars else first_line[:max_chars - 3] + "..."
+
+def prefilter_job_descriptions(resume_text: str, job_descs: list) -> list:
+    """Score how much of each posting's idf-weighted vocabulary appears in the resume (0-100).
+
+    Terms common to most postings ("experience", "team") carry little weight, so the
+    score tracks the distinctive requirements of each posting.
+    """
+    resume_terms = set(tokenize_terms(resume_text))
+    posting_terms = [set(tokenize_terms(job_desc)) for job_desc in job_descs]
+    
+    document_frequency = {}
+    for terms in posting_terms:
+        for term in terms:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+    
+    posting_count = len(job_descs)
+    idf = {term: math.log((posting_count + 1) / (df + 1)) + 1 for term, df in document_frequency.items()}
+    
+    scores = []
+    for terms in posting_terms:
+        total_weight = sum(idf[term] for term in terms)
+        matched_weight = sum(idf[term] for term in terms & resume_terms)
+        scores.append(round(100 * matched_weight / total_weight, 1) if total_weight else 0.0)
+    return scores
+
+def rank_job_descriptions(resume_text: str, job_descs: list, model_choice: str, top_k: int = MULTI_JOB_TOP_K, progress_callback=None) -> list:
+    """Rank postings for one resume: prefilter all of them locally, LLM-score only the top_k.
+
+    Returns one row per posting, LLM-scored postings first by weighted score, the rest
+    by prefilter score. progress_callback(done, total) is called as LLM scores arrive.
+    """
+    prefilter_scores = prefilter_job_descriptions(resume_text, job_descs)
+    rows = [
+        {"index": i, "title": job_title(job_desc), "prefilter_score": score,
+         "selection_percentage": None, "categories": None}
+        for i, (job_desc, score) in enumerate(zip(job_descs, prefilter_scores))
+    ]
+    shortlist = sorted(rows, key=lambda row: row["prefilter_score"], reverse=True)[:top_k]
+    
+    with make_thread_pool(min(LLM_CONCURRENCY, len(shortlist)) or 1) as executor:
+        futures = {
+            executor.submit(run_analysis, "category_scores", job_descs[row["index"]], resume_text, model_choice): row
+            for row in shortlist
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            raw = future.result()
+            if raw:
+                summary = summarize_category_scores(parse_category_response(raw))
+                futures[future]["selection_percentage"] = summary["selection_percentage"]
+                futures[future]["categories"] = summary["categories"]
+            if progress_callback:
+                progress_callback(done, len(shortlist))
+    
+    rows.sort(key=lambda row: (row["selection_percentage"] is not None,
+                               row["selection_percentage"] or 0,
+                               row["prefilter_score"]), reverse=True)
+    for rank, row in enumerate(rows, start=1):
+        row["rank"] = rank
+    return rows
 
-# FIXED: Enhanced PDF generation class to prevent "Not enough horizontal space" error
-class ResumeMatchPDF(FPDF):
-    def header(self):
-        self.set_font('Arial', 'B', 16)
-        self.cell(0, 10, 'ResumeMatch Pro - Analysis Report', 0, 1, 'C')
-        self.ln(5)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
-        self.cell(0, 10, f'Page {self.page_no()} | Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', 0, 0, 'C')
-
-    def chapter_title(self, title):
-        self.set_font('Arial', 'B', 14)
-        self.cell(0, 10, title, 0, 1, 'L')
-        self.ln(2)
-
-    def chapter_body(self, body):
-        self.set_font('Arial', '', 10)
-        # Use multi_cell with explicit width to prevent horizontal space errors
-        self.multi_cell(0, 6, body)
-        self.ln(3)
+def new_report_pdf():
+    """Create the report PDF, importing fpdf only when a report is actually rendered."""
+    from fpdf import FPDF
 
+    # FIXED: Enhanced PDF generation class to prevent "Not enough horizontal space" error
+    class ResumeMatchPDF(FPDF):
+        def header(self):
+            self.set_font('Arial', 'B', 16)
+            self.cell(0, 10, 'ResumeMatch Pro - Analysis Report', 0, 1, 'C')
+            self.ln(5)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font('Arial', 'I', 8)
+            self.cell(0, 10, f'Page {self.page_no()} | Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', 0, 0, 'C')
+
+        def chapter_title(self, title):
+            self.set_font('Arial', 'B', 14)
+            self.cell(0, 10, title, 0, 1, 'L')
+            self.ln(2)
+
+        def chapter_body(self, body):
+            self.set_font('Arial', '', 10)
+            # Use multi_cell with explicit width to prevent horizontal space errors
+            self.multi_cell(0, 6, body)
+            self.ln(3)
+
+    return ResumeMatchPDF()
+
+@timed_span("pdf_report")
 def generate_pdf(report: dict) -> bytes:
     """Enhanced PDF generation with proper error handling."""
-    pdf = ResumeMatchPDF()
+    pdf = new_report_pdf()
     pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=15)
     
@@ -1428,7 +2926,7 @@ def generate_pdf(report: dict) -> bytes:
     except Exception as e:
         # Fallback: Create simple PDF with error message
         st.error(f"PDF generation error: {str(e)}")
-        pdf = ResumeMatchPDF()
+        pdf = new_report_pdf()
         pdf.add_page()
         pdf.set_font('Arial', '', 12)
         pdf.cell(0, 10, 'Error generating detailed report.', 0, 1, 'C')
@@ -1468,6 +2966,9 @@ def main():
     if 'selected_projects' not in st.session_state:
         st.session_state.selected_projects = []
     
+    if 'span_timings' not in st.session_state:
+        st.session_state.span_timings = SpanTimings()
+    
     # Initialize predefined questions session state
     if 'qa_question' not in st.session_state:
         st.session_state['qa_question'] = ''
@@ -1488,7 +2989,11 @@ def main():
             index=MODEL_OPTIONS.index("llama3-70b-8192"),
             help="Choose the AI model for analysis processing"
         )
-        
+
+        # Filled in at the end of the run so they include this run's cache lookups and timings
+        cache_status = st.empty()
+        performance_panel = st.expander("⏱️ Performance", expanded=False)
+
         st.markdown("---")
         
         # Enhanced Quick tips with new styling
@@ -1606,7 +3111,13 @@ def main():
             )
             
             if resume_file:
-                resume_text = extract_text_from_pdf(resume_file)
+                parse_progress = st.progress(0)
+                
+                def report_parse_progress(pages_done, total_pages):
+                    parse_progress.progress(pages_done / total_pages, text=f"Parsing resume: page {pages_done} of {total_pages}")
+                
+                resume_text = extract_text_from_pdf(resume_file, progress_callback=report_parse_progress)
+                parse_progress.empty()
                 
                 if resume_text:
                     st.markdown('<div class="success-alert">🎉 Resume processed successfully! Ready for AI analysis.</div>', unsafe_allow_html=True)
@@ -1679,7 +3190,48 @@ def main():
             """, unsafe_allow_html=True)
         else:
             resume_text = extract_text_from_pdf(resume_file)
-            
+
+            # Full analysis mode: every prompt dispatched at once
+            create_feature_card("⚡ Full Analysis Suite", """
+            Run profile fit, keyword matching and multi-dimensional scoring in parallel.
+            Total time is that of the slowest analysis instead of the sum of all of them.
+            """, "🚀")
+
+            pending_question = st.session_state.get('custom_question', '') or st.session_state['qa_question']
+            include_qa = st.checkbox(
+                "Include AI consultant question",
+                value=False,
+                disabled=not pending_question,
+                help="Also answer the question entered in the AI Resume Consultant section below"
+            )
+
+            if st.button("⚡ Run Full Analysis", key="full_analysis_btn", use_container_width=True):
+                question_for_run = pending_question if include_qa else ""
+                analysis_types = ["profile_fit", "keyword_match", "category_scores"] + (["qa"] if question_for_run else [])
+                status_placeholders = {analysis_type: st.empty() for analysis_type in analysis_types}
+                for analysis_type, placeholder in status_placeholders.items():
+                    placeholder.info(f"{ANALYSIS_LABELS[analysis_type]}: running...")
+
+                completed = 0
+                for analysis_type, text in run_full_analysis(job_desc, resume_text, model_choice, question_for_run):
+                    placeholder = status_placeholders[analysis_type]
+                    if text:
+                        apply_analysis_result(st.session_state.report, analysis_type, text)
+                        completed += 1
+                        if analysis_type == "category_scores":
+                            st.session_state.analysis_complete = True
+                            placeholder.success(
+                                f"{ANALYSIS_LABELS[analysis_type]}: complete - weighted score "
+                                f"{st.session_state.report['selection_percentage']}%"
+                            )
+                        else:
+                            placeholder.success(f"{ANALYSIS_LABELS[analysis_type]}: complete")
+                    else:
+                        placeholder.error(f"{ANALYSIS_LABELS[analysis_type]}: failed")
+
+                if completed:
+                    st.markdown(f'<div class="success-alert">🎉 {completed} of {len(analysis_types)} analyses complete. Full results are available in the Results Dashboard.</div>', unsafe_allow_html=True)
+
             # Enhanced analysis grid
             analysis_col1, analysis_col2 = st.columns(2, gap="large")
             
@@ -1691,60 +3243,27 @@ def main():
                 """, "🤖")
                 
                 if st.button("🚀 Launch Profile Analysis", key="profile_fit_btn", use_container_width=True):
-                    with st.spinner("🧠 AI is analyzing your profile compatibility..."):
-                        progress_placeholder = st.empty()
-                        for i in range(0, 101, 10):
-                            progress_placeholder.markdown(create_progress_bar(i, "Processing Profile Data", "blue"), unsafe_allow_html=True)
-                            time.sleep(0.1)
-                        
-                        seed = generate_deterministic_seed(job_desc, resume_text, "profile_fit")
-                        mt, temp, tp = get_deterministic_params("", job_desc, model_choice)
-                        
-                        fit_prompt = (
-                            "You are an expert Technical HR Manager with deep industry knowledge. "
-                            "Conduct a comprehensive evaluation of this candidate's profile against the job description. "
-                            "Provide your analysis in exactly this format:\n\n"
-                            "**FIT SCORE: [X]%**\n\n"
-                            "**TOP 3 STRENGTHS:**\n"
-                            "1. [Specific strength with concrete example from resume]\n"
-                            "2. [Specific strength with concrete example from resume]\n"
-                            "3. [Specific strength with concrete example from resume]\n\n"
-                            "**TOP 3 IMPROVEMENT AREAS:**\n"
-                            "1. [Specific gap with actionable improvement suggestion]\n"
-                            "2. [Specific gap with actionable improvement suggestion]\n"
-                            "3. [Specific gap with actionable improvement suggestion]\n\n"
-                            "**RECOMMENDATION:**\n"
-                            "[Overall hiring recommendation with reasoning]\n\n"
-                            "Be specific, reference exact details from the resume, and provide actionable insights."
-                        )
-                        
-                        msgs = [
-                            {"role": "system", "content": fit_prompt},
-                            {"role": "user", "content": f"Job Description:\n{job_desc}\n\nResume Text:\n{resume_text}"}
-                        ]
-                        
-                        r = make_api_call_with_reproducibility(client, model_choice, msgs, mt, temp, tp)
+                    # The score bar is filled in once the streamed analysis is complete
+                    score_placeholder = st.empty()
+                    st.markdown("""
+                    <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
+                        <h4 style="color: var(--text-primary); margin-bottom: 1rem;">📋 Detailed AI Analysis</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    stream_metrics = {}
+                    pf = st.write_stream(stream_analysis("profile_fit", job_desc, resume_text, model_choice, metrics=stream_metrics))
+                    
+                    # total_time is only set once the stream completed; a truncated answer is not kept
+                    if pf and "total_time" in stream_metrics:
+                        st.session_state.report["profile_fit"] = pf
+                        show_stream_metrics(stream_metrics)
                         
-                        if r:
-                            pf = r.choices[0].message.content
-                            st.session_state.report["profile_fit"] = pf
-                            
-                            progress_placeholder.empty()
-                            
-                            # Extract and display fit score
-                            fit_score_match = re.search(r'FIT SCORE:\s*(\d+)%', pf)
-                            if fit_score_match:
-                                fit_score = int(fit_score_match.group(1))
-                                gradient_type = "success" if fit_score >= 80 else "warning" if fit_score >= 60 else "danger"
-                                st.markdown(create_progress_bar(fit_score, "🎯 AI Profile Fit Score", gradient_type), unsafe_allow_html=True)
-                            
-                            # Enhanced results display
-                            st.markdown("""
-                            <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
-                                <h4 style="color: var(--text-primary); margin-bottom: 1rem;">📋 Detailed AI Analysis</h4>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            st.markdown(pf)
+                        # Extract and display fit score
+                        fit_score_match = re.search(r'FIT SCORE:\s*(\d+)%', pf)
+                        if fit_score_match:
+                            fit_score = int(fit_score_match.group(1))
+                            gradient_type = "success" if fit_score >= 80 else "warning" if fit_score >= 60 else "danger"
+                            score_placeholder.markdown(create_progress_bar(fit_score, "🎯 AI Profile Fit Score", gradient_type), unsafe_allow_html=True)
                 
                 # Enhanced Keyword Match Analysis
                 create_feature_card("🔍 ATS Keyword Optimization", """
@@ -1753,57 +3272,25 @@ def main():
                 """, "📊")
                 
                 if st.button("🔬 Analyze Keyword Matching", key="keyword_match_btn", use_container_width=True):
-                    with st.spinner("🔍 Scanning for keyword optimization opportunities..."):
-                        progress_placeholder = st.empty()
-                        for i in range(0, 101, 15):
-                            progress_placeholder.markdown(create_progress_bar(i, "Analyzing Keywords", "purple"), unsafe_allow_html=True)
-                            time.sleep(0.1)
-                        
-                        kw_prompt = (
-                            "You are an ATS optimization expert and keyword strategist. "
-                            "Conduct a comprehensive keyword analysis between the resume and job description. "
-                            "Provide your analysis in exactly this format:\n\n"
-                            "**KEYWORD MATCH PERCENTAGE: [X]%**\n\n"
-                            "**10 CRITICAL MISSING KEYWORDS:**\n"
-                            "1. [high-impact keyword]\n2. [high-impact keyword]\n3. [high-impact keyword]\n"
-                            "4. [high-impact keyword]\n5. [high-impact keyword]\n6. [high-impact keyword]\n"
-                            "7. [high-impact keyword]\n8. [high-impact keyword]\n9. [high-impact keyword]\n10. [high-impact keyword]\n\n"
-                            "**ATS OPTIMIZATION RECOMMENDATIONS:**\n"
-                            "• [Specific integration strategy 1]\n"
-                            "• [Specific integration strategy 2]\n"
-                            "• [Specific integration strategy 3]\n"
-                            "• [Specific integration strategy 4]\n\n"
-                            "**INDUSTRY-SPECIFIC INSIGHTS:**\n"
-                            "[Provide industry context and additional recommendations]"
-                        )
-                        
-                        mt, temp, tp = get_deterministic_params("", job_desc, model_choice)
-                        msgs = [
-                            {"role": "system", "content": kw_prompt},
-                            {"role": "user", "content": f"Job Description:\n{job_desc}\n\nResume Text:\n{resume_text}"}
-                        ]
-                        
-                        r = make_api_call_with_reproducibility(client, model_choice, msgs, mt, temp, tp)
+                    score_placeholder = st.empty()
+                    st.markdown("""
+                    <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
+                        <h4 style="color: var(--text-primary); margin-bottom: 1rem;">📊 Keyword Analysis Results</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    stream_metrics = {}
+                    km = st.write_stream(stream_analysis("keyword_match", job_desc, resume_text, model_choice, metrics=stream_metrics))
+                    
+                    if km and "total_time" in stream_metrics:
+                        st.session_state.report["keyword_match"] = km
+                        show_stream_metrics(stream_metrics)
                         
-                        if r:
-                            km = r.choices[0].message.content
-                            st.session_state.report["keyword_match"] = km
-                            
-                            progress_placeholder.empty()
-                            
-                            # Extract and display keyword match
-                            keyword_match = re.search(r'KEYWORD MATCH PERCENTAGE:\s*(\d+)%', km)
-                            if keyword_match:
-                                keyword_score = int(keyword_match.group(1))
-                                gradient_type = "success" if keyword_score >= 80 else "warning" if keyword_score >= 60 else "danger"
-                                st.markdown(create_progress_bar(keyword_score, "🔍 ATS Keyword Match Score", gradient_type), unsafe_allow_html=True)
-                            
-                            st.markdown("""
-                            <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
-                                <h4 style="color: var(--text-primary); margin-bottom: 1rem;">📊 Keyword Analysis Results</h4>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            st.markdown(km)
+                        # Extract and display keyword match
+                        keyword_match = re.search(r'KEYWORD MATCH PERCENTAGE:\s*(\d+)%', km)
+                        if keyword_match:
+                            keyword_score = int(keyword_match.group(1))
+                            gradient_type = "success" if keyword_score >= 80 else "warning" if keyword_score >= 60 else "danger"
+                            score_placeholder.markdown(create_progress_bar(keyword_score, "🔍 ATS Keyword Match Score", gradient_type), unsafe_allow_html=True)
             
             with analysis_col2:
                 # Enhanced Selection Percentage Analysis
@@ -1814,63 +3301,17 @@ def main():
                 
                 if st.button("📊 Launch Comprehensive Evaluation", key="selection_pct_btn", use_container_width=True):
                     with st.spinner("🎯 AI is evaluating across multiple dimensions..."):
-                        progress_placeholder = st.empty()
-                        for i in range(0, 101, 20):
-                            progress_placeholder.markdown(create_progress_bar(i, "Multi-Dimensional Analysis", "success"), unsafe_allow_html=True)
-                            time.sleep(0.15)
-                        
-                        sel_prompt = (
-                            "You are an expert ATS analyst and recruitment specialist. "
-                            "Score the candidate (0–100) in each category based on job alignment. "
-                            "Return ONLY a valid JSON object with this exact format:\n"
-                            "{\n"
-                            '  "skills": [score 0-100],\n'
-                            '  "experience": [score 0-100],\n'
-                            '  "education": [score 0-100],\n'
-                            '  "keywords": [score 0-100],\n'
-                            '  "certifications": [score 0-100]\n'
-                            "}\n"
-                            "Provide only the JSON object without any additional text or explanation."
-                        )
-                        
-                        mt, temp, tp = get_deterministic_params("", job_desc, model_choice)
-                        msgs = [
-                            {"role": "system", "content": sel_prompt},
-                            {"role": "user", "content": f"Job Description:\n{job_desc}\n\nResume Text:\n{resume_text}"}
-                        ]
+                        raw = run_analysis("category_scores", job_desc, resume_text, model_choice)
                         
-                        r = make_api_call_with_reproducibility(client, model_choice, msgs, mt, temp, tp)
-                        
-                        if r:
-                            raw = r.choices[0].message.content
-                            try:
-                                json_match = re.search(r'\{.*\}', raw, re.DOTALL)
-                                if json_match:
-                                    json_str = json_match.group()
-                                    data = json.loads(json_str)
-                                    cats = {k.title(): data.get(k, 0) for k in
-                                            ["skills", "experience", "education", "keywords", "certifications"]}
-                                else:
-                                    raise json.JSONDecodeError("No JSON found", raw, 0)
-                            except json.JSONDecodeError:
-                                cats = parse_category_scores(raw)
-                            
-                            # Use weighted scoring instead of simple average
-                            sel_pct = weighted_score(cats)
-                            positive = [c for c, s in cats.items() if s >= sel_pct]
-                            negative = [c for c, s in cats.items() if s < sel_pct]
-                            
-                            st.session_state.report.update({
-                                "categories": cats,
-                                "selection_percentage": sel_pct,
-                                "positive_categories": positive,
-                                "negative_categories": negative
-                            })
+                        if raw:
+                            apply_analysis_result(st.session_state.report, "category_scores", raw)
+                            cats = st.session_state.report["categories"]
+                            sel_pct = st.session_state.report["selection_percentage"]
+                            positive = st.session_state.report["positive_categories"]
+                            negative = st.session_state.report["negative_categories"]
                             
                             st.session_state.analysis_complete = True
                             
-                            progress_placeholder.empty()
-                            
                             # Enhanced overall score display with weighted indicator
                             gradient_type = "success" if sel_pct >= 80 else "warning" if sel_pct >= 60 else "danger"
                             st.markdown(create_progress_bar(sel_pct, "🏆 Weighted Selection Probability", gradient_type), unsafe_allow_html=True)
@@ -1968,30 +3409,88 @@ def main():
                 )
                 
                 if st.button("🧠 Get AI Insights", key="qa_btn", use_container_width=True) and question:
-                    with st.spinner("🤔 AI consultant is analyzing your question..."):
-                        context = "\n\n".join(chunk_text(resume_text)[:2])
-                        mt, temp, tp = get_deterministic_params("", job_desc + question, model_choice)
-                        
-                        msgs = [
-                            {"role": "system", "content": "You are an expert HR consultant and career advisor. Provide detailed, actionable insights based on the resume content and job requirements. Be specific and reference exact details from the resume."},
-                            {"role": "user", "content": f"Job Description:\n{job_desc}\n\nResume Content:\n{context}\n\nQuestion: {question}"}
-                        ]
-                        
-                        r = make_api_call_with_reproducibility(client, model_choice, msgs, mt, temp, tp)
+                    st.markdown("""
+                    <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
+                        <h4 style="color: var(--text-primary); margin-bottom: 1rem;">💡 AI Consultant Response</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    stream_metrics = {}
+                    qa = st.write_stream(stream_analysis("qa", job_desc, resume_text, model_choice, question, metrics=stream_metrics))
+                    
+                    if qa and "total_time" in stream_metrics:
+                        st.session_state.report["qa_answer"] = qa
+                        show_stream_metrics(stream_metrics)
                         
-                        if r:
-                            qa = r.choices[0].message.content
-                            st.session_state.report["qa_answer"] = qa
-                            
-                            # Clear the question after successful analysis
-                            st.session_state['qa_question'] = ''
-                            
-                            st.markdown("""
-                            <div style="background: rgba(0,0,0,0.8); padding: 2rem; border-radius: 20px; backdrop-filter: blur(15px); margin: 1rem 0; border: 1px solid rgba(0, 255, 65, 0.3);">
-                                <h4 style="color: var(--text-primary); margin-bottom: 1rem;">💡 AI Consultant Response</h4>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            st.markdown(qa)
+                        # Clear the question after successful analysis
+                        st.session_state['qa_question'] = ''
+
+        if resume_file:
+            # Multi-posting mode: one resume against many job descriptions
+            create_feature_card("🗂️ Multi-Posting Ranking", """
+            Rank your resume against many job postings at once. Every posting gets a fast local
+            keyword score, and only the most promising ones are scored by the AI model.
+            """, "📋")
+
+            postings_text = st.text_area(
+                "Job postings (separate postings with a line containing only ---)",
+                height=200,
+                key="multi_job_text"
+            )
+            posting_files = st.file_uploader(
+                "Or upload postings as text files",
+                type=["txt", "md"],
+                accept_multiple_files=True,
+                key="multi_job_files"
+            )
+            job_descs = split_job_descriptions(postings_text)
+            for posting_file in posting_files or []:
+                job_descs.extend(split_job_descriptions(posting_file.getvalue().decode("utf-8", errors="ignore")))
+
+            top_k = len(job_descs)
+            if len(job_descs) > 1:
+                top_k = st.slider(
+                    "Postings to score with AI",
+                    min_value=1,
+                    max_value=min(50, len(job_descs)),
+                    value=min(MULTI_JOB_TOP_K, len(job_descs)),
+                    help="The remaining postings are ranked by keyword prefilter score only"
+                )
+
+            if st.button(f"📋 Rank {len(job_descs)} Postings", key="multi_job_btn", use_container_width=True, disabled=not job_descs):
+                ranking_progress = st.progress(0)
+                ranking_status = st.empty()
+                ranking_status.info(f"Prefiltered {len(job_descs)} postings; scoring the top {min(top_k, len(job_descs))} with AI...")
+
+                def report_ranking_progress(done, total):
+                    ranking_progress.progress(done / total)
+                    ranking_status.info(f"AI scored {done} of {total} shortlisted postings...")
+
+                resume_text = extract_text_from_pdf(resume_file)
+                st.session_state.multi_job_ranking = rank_job_descriptions(
+                    resume_text, job_descs, model_choice, top_k, report_ranking_progress
+                )
+                ranking_status.empty()
+                ranking_progress.empty()
+
+            if st.session_state.get("multi_job_ranking"):
+                ranking_df = pd.DataFrame([
+                    {
+                        "Rank": row["rank"],
+                        "Posting": row["title"],
+                        "Weighted Score": row["selection_percentage"],
+                        **(row["categories"] or {}),
+                        "Keyword Prefilter": row["prefilter_score"]
+                    }
+                    for row in st.session_state.multi_job_ranking
+                ])
+                st.dataframe(ranking_df, use_container_width=True, hide_index=True)
+                st.download_button(
+                    "📥 Download Ranking (CSV)",
+                    data=ranking_df.to_csv(index=False).encode("utf-8"),
+                    file_name="job_ranking.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
     
     # Tab 3: Enhanced GitHub Intelligence
     with tab3:
@@ -2030,6 +3529,16 @@ def main():
             col_github1, col_github2 = st.columns([2, 1], gap="large")
             
             with col_github1:
+                index_refreshed_at = github_repo_store.refreshed_at(username)
+                refresh_repositories = False
+                if index_refreshed_at is not None and github_repo_store.is_fresh(username):
+                    refresh_repositories = st.checkbox(
+                        f"🔄 Refresh from GitHub (local index updated at {datetime.fromtimestamp(index_refreshed_at).strftime('%H:%M:%S')})",
+                        value=False,
+                        help="Stored repositories and their relevance index are reused until they expire or are refreshed; "
+                             "a refresh only refetches details for repositories that changed"
+                    )
+                
                 if st.button("🚀 Launch GitHub Intelligence Analysis", key="github_analyze_btn", use_container_width=True):
                     # Enhanced progress tracking with multiple stages
                     progress_container = st.container()
@@ -2048,45 +3557,53 @@ def main():
                         # Stage 1: Repository Discovery
                         status_text.markdown("**Stage 1:** 🔍 Repository Discovery & Filtering")
                         stage_info.info("Scanning GitHub repositories and applying intelligent filters...")
-                        progress_bar.progress(10)
-                        time.sleep(1)
                         
-                        repositories = fetch_github_repositories_exclude_user(username)
-                        progress_bar.progress(25)
+                        # Resume projects are extracted up front so repositories can be
+                        # scored page by page while later pages are still downloading
+                        existing_projects = extract_existing_projects_from_resume(resume_text)
+                        
+                        # Stored repositories and their relevance index are reused across
+                        # job descriptions and sessions until the local index goes stale
+                        if github_repo_store.is_fresh(username) and not refresh_repositories:
+                            repo_index = github_repo_store.get_index(username)
+                            stage_info.info(f"Loaded {len(repo_index)} repositories from the local index")
+                        else:
+                            def collect_repositories():
+                                discovered = 0
+                                for repo_data in refresh_github_repositories(username):
+                                    discovered += 1
+                                    if discovered % 10 == 0:
+                                        stage_info.info(f"Scanning GitHub repositories... {discovered} discovered so far")
+                                    yield repo_data
+                            
+                            refresh_started = time.time()
+                            repo_index = RepoTermIndex(collect_repositories())
+                            # Only an index from a listing this run committed is memoized; an
+                            # interrupted one leaves the previous refresh timestamp in place
+                            completed_at = github_repo_store.refreshed_at(username)
+                            if completed_at is not None and completed_at >= refresh_started:
+                                github_repo_store.remember_index(username, repo_index, completed_at)
+                        repositories = repo_index.repos
+                        
+                        selected_projects = compare_and_select_projects(
+                            repo_index, existing_projects, job_desc, model_choice, max_projects
+                        )
+                        progress_bar.progress(50)
                         
                         if repositories:
                             status_text.markdown(f"**Stage 1 Complete:** ✅ Discovered {len(repositories)} repositories")
                             stage_info.success(f"Found {len(repositories)} non-forked repositories for analysis")
-                            time.sleep(0.5)
                             
                             # Stage 2: Resume Project Analysis
-                            status_text.markdown("**Stage 2:** 📋 Resume Project Intelligence")
-                            stage_info.info("Analyzing existing projects in resume for duplicate detection...")
-                            progress_bar.progress(40)
-                            time.sleep(1)
-                            
-                            existing_projects = extract_existing_projects_from_resume(resume_text)
-                            progress_bar.progress(55)
-                            
                             if existing_projects:
                                 status_text.markdown(f"**Stage 2 Complete:** ✅ Found {len(existing_projects)} existing resume projects")
                                 stage_info.success("Resume project analysis complete - duplicate detection active")
                             else:
                                 status_text.markdown("**Stage 2 Complete:** ✅ No existing projects found")
                                 stage_info.info("No duplicate projects detected - full repository pool available")
-                            time.sleep(0.5)
-                            
-                            # Stage 3: AI-Powered Selection
-                            status_text.markdown("**Stage 3:** 🤖 AI-Powered Job Relevance Analysis")
-                            stage_info.info("AI is analyzing job relevance and ranking projects...")
-                            progress_bar.progress(70)
-                            time.sleep(1.5)
-                            
-                            selected_projects = compare_and_select_projects(
-                                repositories, existing_projects, job_desc, model_choice, max_projects
-                            )
-                            progress_bar.progress(85)
+                            progress_bar.progress(75)
                             
+                            # Stage 3: AI-Powered Selection (already scored while repositories streamed in)
                             if selected_projects:
                                 st.session_state.selected_projects = selected_projects
                                 
@@ -2094,10 +3611,8 @@ def main():
                                 status_text.markdown("**Stage 4:** ✅ Analysis Complete!")
                                 stage_info.success("AI analysis pipeline executed successfully")
                                 progress_bar.progress(100)
-                                time.sleep(0.5)
                                 
-                                # Clear progress indicators with fade effect
-                                time.sleep(1)
+                                # Clear progress indicators
                                 progress_container.empty()
                                 
                                 # Enhanced success display
@@ -2161,12 +3676,13 @@ def main():
                                 # Enhanced project descriptions generation
                                 with st.spinner("🔄 AI is generating optimized project descriptions..."):
                                     progress_desc = st.progress(0)
-                                    for i in range(0, 101, 20):
-                                        progress_desc.progress(i)
-                                        time.sleep(0.1)
+                                    
+                                    def report_description_progress(completed, total):
+                                        progress_desc.progress(completed / total, text=f"{completed}/{total} project descriptions generated")
                                     
                                     project_descriptions = generate_project_descriptions_for_download(
-                                        selected_projects, job_desc, model_choice
+                                        selected_projects, job_desc, model_choice,
+                                        progress_callback=report_description_progress
                                     )
                                     progress_desc.empty()
                                 
@@ -2410,7 +3926,7 @@ def main():
                     # Enhanced JSON Export
                     st.download_button(
                         label="📊 Raw Data Export (JSON)",
-                        data=json.dumps(st.session_state.report, indent=2).encode('utf-8'),
+                        data=json.dumps({**st.session_state.report, "timings": get_span_timings().snapshot()}, indent=2).encode('utf-8'),
                         file_name=f"analysis_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json",
                         help="Download analysis results in JSON format",
@@ -2422,6 +3938,7 @@ def main():
                         combined_data = {
                             "analysis_report": st.session_state.report,
                             "github_projects": st.session_state.selected_projects,
+                            "timings": get_span_timings().snapshot(),
                             "metadata": {
                                 "generated_on": datetime.now().isoformat(),
                                 "selection_criteria": "AI job relevance matching",
@@ -2498,6 +4015,15 @@ def main():
                         </div>
                         """, unsafe_allow_html=True)
     
+    if llm_cache.enabled:
+        cache_stats = llm_cache.stats()
+        cache_status.caption(
+            f"🗄️ Response cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"({cache_stats['hit_ratio'] * 100:.0f}% hit ratio)"
+        )
+    with performance_panel:
+        render_performance_panel()
+    
     # Enhanced Footer with modern styling
     st.markdown("---")
     st.markdown("""
@@ -0,0 +1,178 @@
+"""Headless batch scoring of many resumes against one job description.
+
+Reuses the app's PDF extraction, category-scoring prompt and weighted_score, runs
+resumes through a bounded worker pool and streams one result row per resume to a
+JSONL or CSV file. Resumes already scored successfully in the output file are
+skipped, so an interrupted run picks up where it stopped.
+
+Usage:
+    python batch_score.py resumes/ --job-description posting.txt --output scores.jsonl
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import app
+
+CATEGORIES = ["Skills", "Experience", "Education", "Keywords", "Certifications"]
+CSV_FIELDS = ["resume", "sha256", "status", "selection_percentage", *CATEGORIES, "model", "scored_at", "error"]
+DEFAULT_MODEL = "llama3-70b-8192"
+
+def find_resumes(directory: str, recursive: bool = False) -> list:
+    """Return the PDF files under directory, sorted for a stable processing order."""
+    pattern = os.path.join(directory, "**", "*") if recursive else os.path.join(directory, "*")
+    return sorted(path for path in glob.glob(pattern, recursive=recursive)
+                  if path.lower().endswith(".pdf") and os.path.isfile(path))
+
+def load_checkpoint(output_path: str) -> set:
+    """Return the (resume, sha256, model) triples already scored successfully in output_path."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "r", encoding="utf-8", newline="") as fh:
+        if output_path.endswith(".csv"):
+            rows = csv.DictReader(fh)
+        else:
+            rows = []
+            for line in fh:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+        for row in rows:
+            if row.get("status") == "ok":
+                done.add((row.get("resume"), row.get("sha256"), row.get("model")))
+    return done
+
+class ResultWriter:
+    """Append result rows to a JSONL or CSV file, flushing after every row."""
+
+    def __init__(self, output_path: str):
+        self.is_csv = output_path.endswith(".csv")
+        write_header = self.is_csv and (not os.path.exists(output_path) or os.path.getsize(output_path) == 0)
+        self._fh = open(output_path, "a", encoding="utf-8", newline="")
+        self._lock = threading.Lock()
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._fh, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if write_header:
+                self._csv.writeheader()
+
+    def write(self, row: dict) -> None:
+        with self._lock:
+            if self.is_csv:
+                self._csv.writerow({**row, **row.get("categories", {})})
+            else:
+                self._fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+def score_resume(path: str, resume_name: str, digest: str, job_description: str, model_choice: str) -> dict:
+    """Extract one resume and score it with the category-scoring prompt."""
+    row = {
+        "resume": resume_name,
+        "sha256": digest,
+        "model": model_choice,
+        "scored_at": datetime.now().isoformat(timespec="seconds")
+    }
+    try:
+        resume_text = app.extract_text_from_pdf(path)
+        if not resume_text.strip():
+            return {**row, "status": "error", "error": "No extractable text"}
+
+        # Errors are raised rather than shown with st.error, which does nothing outside Streamlit
+        raw = app.run_analysis("category_scores", job_description, resume_text, model_choice, raise_errors=True)
+        if raw is None:
+            return {**row, "status": "error", "error": "No analysis returned; for long resumes, every condense call failed"}
+
+        summary = app.summarize_category_scores(app.parse_category_response(raw))
+        return {
+            **row,
+            "status": "ok",
+            "selection_percentage": summary["selection_percentage"],
+            "categories": summary["categories"]
+        }
+    except Exception as e:
+        return {**row, "status": "error", "error": str(e)}
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("resume_dir", help="Directory containing PDF resumes")
+    parser.add_argument("--job-description", required=True, help="Text file containing the job description")
+    parser.add_argument("--output", default="batch_scores.jsonl", help="Output file (.jsonl or .csv)")
+    parser.add_argument("--model", default=DEFAULT_MODEL, choices=app.MODEL_OPTIONS)
+    parser.add_argument("--concurrency", type=int, default=app.LLM_CONCURRENCY,
+                        help="Maximum resumes processed at once (default: RESUMEMATCH_LLM_CONCURRENCY)")
+    parser.add_argument("--recursive", action="store_true", help="Search resume_dir recursively")
+    args = parser.parse_args()
+
+    # app's own check only calls st.error/st.stop, which are no-ops outside Streamlit
+    if not app.GROQ_API_KEY and not app.service_backends.is_offline(app.service_backends.LLM_BACKEND):
+        parser.error("GROQ_API_KEY is not set; add it to your environment or .env file")
+
+    with open(args.job_description, "r", encoding="utf-8") as fh:
+        job_description = fh.read().strip()
+    if not job_description:
+        parser.error("job description file is empty")
+
+    resumes = find_resumes(args.resume_dir, args.recursive)
+    if not resumes:
+        parser.error(f"no PDF files found in {args.resume_dir}")
+
+    done = load_checkpoint(args.output)
+    pending = []
+    for path in resumes:
+        resume_name = os.path.relpath(path, args.resume_dir)
+        digest = file_sha256(path)
+        if (resume_name, digest, args.model) not in done:
+            pending.append((path, resume_name, digest))
+
+    skipped = len(resumes) - len(pending)
+    print(f"{len(resumes)} resumes found, {skipped} already scored, {len(pending)} to process", file=sys.stderr)
+
+    writer = ResultWriter(args.output)
+    executor = ThreadPoolExecutor(max_workers=max(1, args.concurrency))
+    failures = 0
+    try:
+        futures = [
+            executor.submit(score_resume, path, resume_name, digest, job_description, args.model)
+            for path, resume_name, digest in pending
+        ]
+        for completed, future in enumerate(as_completed(futures), start=1):
+            row = future.result()
+            writer.write(row)
+            if row["status"] == "ok":
+                outcome = f"{row['selection_percentage']}%"
+            else:
+                failures += 1
+                outcome = f"error: {row['error']}"
+            print(f"[{completed}/{len(pending)}] {row['resume']}: {outcome}", file=sys.stderr)
+    except KeyboardInterrupt:
+        # Drop queued resumes; rows already written are the checkpoint
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("Interrupted; rerun the same command to resume", file=sys.stderr)
+        raise SystemExit(130)
+    finally:
+        executor.shutdown(wait=True)
+        writer.close()
+
+    if failures:
+        print(f"{failures} resumes failed and will be retried on the next run", file=sys.stderr)
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
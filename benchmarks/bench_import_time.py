@@ -0,0 +1,124 @@
+"""Benchmark the cold-start cost of importing app.py.
+
+Imports the app in fresh interpreters under `python -X importtime` and reports the
+cumulative import time of app, process wall time, peak RSS, the slowest top-level
+imports and which heavy optional modules were loaded at startup. Pass
+--baseline-ref to measure an earlier git revision (checked out in a temporary
+worktree) alongside the working tree.
+
+Usage:
+    python benchmarks/bench_import_time.py --repeat 5
+    python benchmarks/bench_import_time.py --baseline-ref HEAD~1 --output import_bench.json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only some sessions need; none should load just by starting the app
+HEAVY_MODULES = ["pandas", "plotly.express", "fpdf", "PyPDF2", "tiktoken", "streamlit_lottie", "streamlit_option_menu"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def parse_importtime(stderr: str) -> list:
+    """Return (module, self_us, cumulative_us, depth) tuples from -X importtime output."""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+def measure_once(cwd: str, module: str) -> dict:
+    env = {
+        **os.environ,
+        "GROQ_API_KEY": os.environ.get("GROQ_API_KEY", "benchmark"),
+        "RESUMEMATCH_CACHE_DIR": tempfile.mkdtemp(prefix="resumematch-import-"),
+    }
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    stderr = process.stderr.read()
+    _, status, rusage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"import {module} failed in {cwd}:\n{stderr[-2000:]}")
+
+    entries = parse_importtime(stderr)
+    loaded = {name for name, _, _, _ in entries}
+    app_entry = next((entry for entry in reversed(entries) if entry[0] == module and entry[3] == 0), None)
+    # Direct imports of the app module, i.e. one level below it
+    top_level = [(name, cumulative) for name, _, cumulative, depth in entries if depth == 1]
+    return {
+        "import_ms": app_entry[2] / 1000 if app_entry else None,
+        "wall_ms": wall * 1000,
+        "peak_rss_kb": rusage.ru_maxrss,
+        "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in loaded],
+        "top_imports": sorted(top_level, key=lambda item: item[1], reverse=True),
+    }
+
+def measure(label: str, cwd: str, module: str, repeat: int) -> dict:
+    # First run warms the OS file cache so every measured run sees the same disk state
+    measure_once(cwd, module)
+    runs = [measure_once(cwd, module) for _ in range(repeat)]
+    return {
+        "target": label,
+        "import_ms": round(statistics.median(run["import_ms"] for run in runs), 1),
+        "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 1),
+        "peak_rss_kb": int(statistics.median(run["peak_rss_kb"] for run in runs)),
+        "heavy_modules_loaded": runs[-1]["heavy_modules_loaded"],
+        "top_imports": [(name, round(us / 1000, 1)) for name, us in runs[-1]["top_imports"][:10]],
+    }
+
+def measure_revision(ref: str, module: str, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        worktree = os.path.join(directory, "tree")
+        subprocess.run(["git", "worktree", "add", "--detach", worktree, ref], cwd=REPO_ROOT,
+                       check=True, capture_output=True)
+        try:
+            return measure(ref, worktree, module, repeat)
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=REPO_ROOT, capture_output=True)
+
+def print_result(result: dict) -> None:
+    print(f"{result['target']}: import {result['import_ms']:.1f} ms, wall {result['wall_ms']:.1f} ms, "
+          f"peak RSS {result['peak_rss_kb'] / 1024:.1f} MB")
+    print(f"  heavy modules loaded at startup: {', '.join(result['heavy_modules_loaded']) or 'none'}")
+    for name, ms in result["top_imports"]:
+        print(f"  {ms:9.1f} ms  {name}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app", help="Module to import (default: app)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline-ref", help="Also measure this git revision, e.g. HEAD~1")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    if args.baseline_ref:
+        results.append(measure_revision(args.baseline_ref, args.module, args.repeat))
+        print_result(results[-1])
+    results.append(measure("working tree", REPO_ROOT, args.module, args.repeat))
+    print_result(results[-1])
+
+    if len(results) == 2:
+        before, after = results
+        print(f"\nimport time {before['import_ms']:.1f} -> {after['import_ms']:.1f} ms, "
+              f"peak RSS {before['peak_rss_kb'] / 1024:.1f} -> {after['peak_rss_kb'] / 1024:.1f} MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark PDF text extraction backends against the original PyPDF2 path.
+
+Builds a fixture corpus of generated resumes/portfolios of varying length, then
+measures throughput (pages/sec) and memory for every installed backend,
+sequentially and with page-level process parallelism. Each configuration runs in
+a fresh interpreter so RSS figures are not polluted by earlier runs. The stage
+figure is how far extraction raised the process peak above the peak reached
+once the fixture was loaded; the process and worker peaks are reported as-is.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py --pages 1 2 5 20 60 --repeat 3
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpdf import FPDF
+
+import pdf_extraction
+
+PARAGRAPH = (
+    "Senior software engineer with experience building distributed data pipelines in Python, "
+    "Go and Rust. Led migration of batch ETL jobs to streaming Kafka consumers, reducing "
+    "end-to-end latency from hours to seconds. Designed REST and gRPC APIs, container "
+    "orchestration with Kubernetes, and CI/CD workflows on GitHub Actions. "
+)
+
+def build_fixture(page_count: int) -> bytes:
+    """Generate a text-heavy PDF with page_count pages."""
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=False)
+    for page_number in range(page_count):
+        pdf.add_page()
+        pdf.set_font("Helvetica", "B", 14)
+        pdf.cell(0, 10, f"SECTION {page_number + 1}: EXPERIENCE", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.multi_cell(0, 5, PARAGRAPH * 8)
+    return bytes(pdf.output())
+
+def build_corpus(page_counts: list, directory: str) -> list:
+    paths = []
+    for page_count in page_counts:
+        path = os.path.join(directory, f"fixture_{page_count:03d}p.pdf")
+        with open(path, "wb") as fh:
+            fh.write(build_fixture(page_count))
+        paths.append(path)
+    return paths
+
+def legacy_extract(data: bytes) -> str:
+    """The original extract_text_from_pdf implementation."""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+def _measure(backend: str, parallel: bool, path: str, repeat: int, queue) -> None:
+    with open(path, "rb") as fh:
+        data = fh.read()
+
+    timings = []
+    pages = 0
+    if backend == "legacy-pypdf2":
+        # Counted outside the timed loop, so the baseline times only the extraction
+        pages = pdf_extraction.PDF_BACKENDS["pypdf2"][1](data)
+    # ru_maxrss only ever rises, so growth past this mark is what extraction added
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if backend == "legacy-pypdf2":
+            text = legacy_extract(data)
+        else:
+            page_texts = pdf_extraction.extract_pdf_pages(data, backend=backend, parallel=parallel)
+            pages = len(page_texts)
+            text = "\n".join(page_texts)
+        timings.append(time.perf_counter() - start)
+
+    if parallel:
+        # Reap pool workers so RUSAGE_CHILDREN covers them and the process can exit
+        pdf_extraction.get_process_pool().shutdown()
+
+    best = min(timings)
+    queue.put({
+        "backend": backend,
+        "parallel": parallel,
+        "fixture": os.path.basename(path),
+        "pages": pages,
+        "chars": len(text),
+        "best_seconds": round(best, 5),
+        "pages_per_sec": round(pages / best, 1) if best else None,
+        "stage_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+        "process_peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "peak_worker_rss_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    })
+
+def collect_result(process, queue, timeout: float) -> dict:
+    """Wait for the measuring process's result, or report why none arrived.
+
+    Polls so a crashed child is reported straight away instead of after the full
+    timeout; a child still running at the deadline is terminated.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = queue.get(timeout=1)
+            break
+        except queue_module.Empty:
+            if not process.is_alive():
+                # The child may have exited right after flushing its result
+                try:
+                    result = queue.get(timeout=1)
+                    break
+                except queue_module.Empty:
+                    process.join()
+                    return {"error": f"measuring process exited with code {process.exitcode} and no result"}
+            if time.monotonic() >= deadline:
+                process.terminate()
+                process.join()
+                return {"error": f"no result within {timeout:g}s; measuring process terminated"}
+    process.join()
+    return result
+
+def run_isolated(backend: str, parallel: bool, path: str, repeat: int, timeout: float) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure, args=(backend, parallel, path, repeat, queue))
+    process.start()
+    result = collect_result(process, queue, timeout)
+    if "error" in result:
+        result.update(backend=backend, parallel=parallel, fixture=os.path.basename(path))
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5, 20, 60])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for each configuration")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    configurations = [("legacy-pypdf2", False)]
+    for backend in pdf_extraction.available_backends():
+        configurations.append((backend, False))
+        configurations.append((backend, True))
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for path in build_corpus(args.pages, directory):
+            for backend, parallel in configurations:
+                result = run_isolated(backend, parallel, path, args.repeat, args.timeout)
+                results.append(result)
+                mode = "parallel" if parallel else "sequential"
+                if "error" in result:
+                    print(f"{result['fixture']:<20} {backend:<14} {mode:<10} failed: {result['error']}")
+                    continue
+                print(f"{result['fixture']:<20} {backend:<14} {mode:<10} "
+                      f"{result['pages_per_sec']:>9} pages/s  "
+                      f"stage RSS +{result['stage_rss_kb'] / 1024:.1f} MB  "
+                      f"process peak {result['process_peak_rss_kb'] / 1024:.1f} MB "
+                      f"(workers {result['peak_worker_rss_kb'] / 1024:.1f} MB)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"workers": pdf_extraction.PDF_WORKERS, "results": results}, fh, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark GitHub project scoring against the original per-repo loop.
+
+Generates synthetic repository sets and reports the time to build the BM25
+RepoTermIndex, the time to rank against an already built index, and how many of
+the selected projects agree with the original whitespace-token implementation.
+Speedups over the original loop are printed for a fresh fetch (build + rank) and
+for re-scoring a memoized index (rank only).
+
+Usage:
+    python benchmarks/bench_project_scoring.py --repos 1000 10000 --repeat 3
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+import app
+
+WORDS = (
+    "python rust go java typescript react django flask kafka spark airflow kubernetes docker "
+    "terraform aws gcp azure postgres redis graphql rest grpc api pipeline etl streaming ml "
+    "pytorch tensorflow nlp vision cli dashboard tracker bot scraper engine service sdk "
+    "the and a of for with to in data web app tool library framework realtime async"
+).split()
+LANGUAGES = ["Python", "Go", "Rust", "TypeScript", "JavaScript", "Java", "C++", "Shell"]
+JOB_DESCRIPTION = (
+    "We are hiring a senior data engineer to build streaming pipelines with Kafka and Spark, "
+    "design REST and gRPC APIs in Python and Go, and run services on Kubernetes in AWS. "
+    "Experience with Airflow, Postgres, Redis and Terraform is a plus."
+)
+EXISTING_PROJECTS = [
+    {"title": "Realtime Kafka Pipeline", "description": "Streaming ETL with Spark"},
+    {"title": "Expense Tracker", "description": "Django web app"},
+    {"title": "Portfolio Website", "description": "React site"},
+]
+
+def build_repositories(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    repos = []
+    for i in range(count):
+        name = "-".join(rng.sample(WORDS, rng.randint(1, 3))) + f"-{i}"
+        repos.append({
+            "name": name,
+            "description": " ".join(rng.choices(WORDS, k=rng.randint(0, 25))),
+            "languages": rng.sample(LANGUAGES, rng.randint(0, 3)),
+            "topics": rng.sample(WORDS, rng.randint(0, 5)),
+        })
+    return repos
+
+def legacy_select(repositories, existing_projects, job_description, max_projects):
+    """The original compare_and_select_projects scoring loop."""
+    existing_titles = [app.safe_get_string(proj.get('title', '')).lower() for proj in existing_projects]
+    scored_repos = []
+    for repo in repositories:
+        repo_name = app.safe_get_string(repo.get('name', ''))
+        repo_name_lower = repo_name.lower().replace('-', ' ').replace('_', ' ')
+        similarity_penalty = 0
+        for existing_title in existing_titles:
+            if any(word in existing_title for word in repo_name_lower.split() if word):
+                similarity_penalty += 5
+        job_keywords = set(app.safe_get_string(job_description, '').lower().split())
+        repo_keywords = set()
+        repo_keywords.update(repo_name.lower().split())
+        repo_description = app.safe_get_string(repo.get('description', ''))
+        if repo_description:
+            repo_keywords.update(repo_description.lower().split())
+        for lang in repo.get('languages', []) or []:
+            if lang:
+                repo_keywords.add(app.safe_get_string(lang).lower())
+        for topic in repo.get('topics', []) or []:
+            if topic:
+                repo_keywords.add(app.safe_get_string(topic).lower())
+        relevance_score = len(job_keywords.intersection(repo_keywords))
+        exact_matches = 0
+        for keyword in job_keywords:
+            if keyword in repo_name.lower() or keyword in repo_description.lower():
+                exact_matches += 2
+        scored_repos.append((repo, relevance_score + exact_matches - similarity_penalty, relevance_score))
+    scored_repos.sort(key=lambda x: x[1], reverse=True)
+    return [repo for repo, score, relevance in scored_repos[:max_projects]]
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-projects", type=int, default=8)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.repos:
+        repos = build_repositories(count)
+        expected = legacy_select(repos, EXISTING_PROJECTS, JOB_DESCRIPTION, args.max_projects)
+        actual = app.compare_and_select_projects(repos, EXISTING_PROJECTS, JOB_DESCRIPTION, "", args.max_projects)
+        agreement = len({r["name"] for r in expected} & {r["name"] for r in actual})
+
+        index = app.RepoTermIndex(repos)
+        result = {
+            "repos": count,
+            "selection_agreement": agreement,
+            "legacy_seconds": best_of(args.repeat, lambda: legacy_select(repos, EXISTING_PROJECTS, JOB_DESCRIPTION, args.max_projects)),
+            "index_build_seconds": best_of(args.repeat, lambda: app.RepoTermIndex(repos)),
+            "score_seconds": best_of(args.repeat, lambda: app.compare_and_select_projects(index, EXISTING_PROJECTS, JOB_DESCRIPTION, "", args.max_projects)),
+        }
+        result["end_to_end_seconds"] = result["index_build_seconds"] + result["score_seconds"]
+        results.append(result)
+        print(f"{count:>7} repos  legacy {result['legacy_seconds'] * 1000:9.1f} ms  "
+              f"index {result['index_build_seconds'] * 1000:8.1f} ms  "
+              f"score {result['score_seconds'] * 1000:8.1f} ms  "
+              f"fresh fetch {result['legacy_seconds'] / result['end_to_end_seconds']:5.1f}x  "
+              f"re-score {result['legacy_seconds'] / result['score_seconds']:5.1f}x  "
+              f"agreement {agreement}/{args.max_projects}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""End-to-end benchmark suite for the ResumeMatch Pro analysis pipeline.
+
+Runs every stage against generated fixtures with the stub Groq and GitHub
+backends: PDF extraction over resumes of varying length, project selection over
+10 to 10k synthetic repositories, prompt building and analysis calls with long
+job descriptions, text sanitizing and PDF report rendering. Each stage and size
+runs in a fresh interpreter with caches disabled, and reports ops/sec, p50/p95
+latency, how far the timed iterations raised peak RSS above the peak reached
+after setup and warmup, and the whole-process peak RSS. Results are written to JSON; pass a previous results file
+as --baseline to print the change per case.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --stages compare_and_select_projects --baseline bench.json
+"""
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from bench_pdf_extraction import collect_result
+
+# Offline backends and no caching, so every iteration does the real work
+BENCH_ENV = {
+    "RESUMEMATCH_BACKEND": "stub",
+    "RESUMEMATCH_LLM_CACHE_MAX_MB": "0",
+    "RESUMEMATCH_PDF_CACHE_MAX_MB": "0",
+    "RESUMEMATCH_PDF_MEMORY_CACHE_ENTRIES": "0",
+}
+
+JOB_PARAGRAPH = (
+    "We are hiring a senior data engineer to build streaming pipelines with Kafka and Spark, "
+    "design REST and gRPC APIs in Python and Go, and run services on Kubernetes in AWS. "
+    "You will own data quality, mentor engineers, and partner with product on roadmap planning. "
+    "Experience with Airflow, Postgres, Redis, Terraform and CI/CD is a plus. "
+)
+REPORT_PARAGRAPH = (
+    "FIT SCORE: 78%\nThe candidate shows strong alignment with the streaming and API requirements — "
+    "Kafka, Spark and gRPC appear across three roles. Gaps: limited Terraform evidence, no Airflow. "
+    "Recommendations: quantify pipeline throughput “10x” gains and list certifications. "
+)
+EXISTING_PROJECTS = [
+    {"title": "Realtime Kafka Pipeline", "description": "Streaming ETL with Spark"},
+    {"title": "Expense Tracker", "description": "Django web app"},
+]
+
+def long_job_description(words: int) -> str:
+    paragraph_words = len(JOB_PARAGRAPH.split())
+    return (JOB_PARAGRAPH * math.ceil(words / paragraph_words)).strip()
+
+def resume_text(pages: int) -> str:
+    from bench_pdf_extraction import PARAGRAPH
+    return "\n\n".join(f"SECTION {page + 1}: EXPERIENCE\n{PARAGRAPH * 8}" for page in range(pages))
+
+# Each case factory runs in the measuring process: it builds the fixture and
+# returns the zero-argument operation to time.
+
+def case_extract_text_from_pdf(pages: int):
+    import app
+    from bench_pdf_extraction import build_fixture
+    data = build_fixture(pages)
+    return lambda: app.extract_text_from_pdf(data)
+
+def case_compare_and_select_projects(repos: int):
+    import app
+    from bench_project_scoring import build_repositories
+    repositories = build_repositories(repos)
+    job_description = long_job_description(800)
+    return lambda: app.compare_and_select_projects(repositories, EXISTING_PROJECTS, job_description, "", 8)
+
+def case_github_fetch(repos: int):
+    import app
+    runs = itertools.count()
+    # A new username each run, so the repository store never supplies known languages
+    return lambda: list(app.refresh_github_repositories(f"benchmark-user-{next(runs)}"))
+
+def case_sanitize_text(kilobytes: int):
+    import app
+    text = REPORT_PARAGRAPH * math.ceil(kilobytes * 1024 / len(REPORT_PARAGRAPH))
+    return lambda: app.sanitize_text(text)
+
+def case_generate_pdf(kilobytes: int):
+    import app
+    text = REPORT_PARAGRAPH * math.ceil(kilobytes * 1024 / len(REPORT_PARAGRAPH))
+    report = {
+        "job_description": long_job_description(800),
+        "profile_fit": text,
+        "keyword_match": text,
+        "qa_answer": text,
+        "categories": {"Skills": 80, "Experience": 70, "Education": 60, "Keywords": 75, "Certifications": 40},
+        "selection_percentage": 71
+    }
+    return lambda: app.generate_pdf(report)
+
+def case_prompt_building(words: int):
+    import app
+    job_description = long_job_description(words)
+    resume = resume_text(2)
+
+    def build_all():
+        for analysis_type in app.ANALYSIS_PROMPTS:
+            app.prepare_analysis_request(analysis_type, job_description, resume, "llama3-70b-8192",
+                                         "How can I improve my resume?")
+    return build_all
+
+def case_run_analysis(words: int):
+    import app
+    job_description = long_job_description(words)
+    resume = resume_text(2)
+    return lambda: app.run_analysis("category_scores", job_description, resume, "llama3-70b-8192")
+
+def case_condense_resume(pages: int):
+    import app
+    job_description = long_job_description(800)
+    resume = resume_text(pages)
+    return lambda: app.run_analysis("profile_fit", job_description, resume, "llama3-70b-8192")
+
+# stage -> (case factory, size unit, default sizes, quick sizes, extra environment per size)
+STAGES = {
+    "extract_text_from_pdf": (case_extract_text_from_pdf, "pages", [1, 5, 20, 60], [1, 5], None),
+    "compare_and_select_projects": (case_compare_and_select_projects, "repos", [10, 100, 1000, 10000], [10, 1000], None),
+    "github_fetch": (case_github_fetch, "repos", [10, 100, 1000], [10, 100],
+                     lambda size: {"RESUMEMATCH_STUB_GITHUB_REPOS": str(size), "RESUMEMATCH_GITHUB_CACHE_MAX_MB": "0"}),
+    "sanitize_text": (case_sanitize_text, "KB", [1, 16, 256], [1, 16], None),
+    "generate_pdf": (case_generate_pdf, "KB", [1, 16, 64], [1, 16], None),
+    "prompt_building": (case_prompt_building, "job description words", [200, 2000, 5000], [200, 2000], None),
+    "run_analysis": (case_run_analysis, "job description words", [200, 2000], [200], None),
+    "condense_resume": (case_condense_resume, "resume pages", [20, 60], [20], None),
+}
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+def _measure(stage: str, size: int, iterations: int, warmup: int, env: dict, queue) -> None:
+    os.environ.update(env)
+    sys.path.insert(0, BENCH_DIR)
+    try:
+        operation = STAGES[stage][0](size)
+        for _ in range(warmup):
+            operation()
+
+        # ru_maxrss only ever rises, so growth past this mark is what the timed runs added
+        baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - start)
+    except Exception as e:
+        queue.put({"stage": stage, "size": size, "error": f"{type(e).__name__}: {e}"})
+        return
+
+    total = sum(timings)
+    queue.put({
+        "stage": stage,
+        "size": size,
+        "size_unit": STAGES[stage][1],
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total, 2) if total else None,
+        "mean_ms": round(statistics.mean(timings) * 1000, 3),
+        "p50_ms": round(percentile(timings, 50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 95) * 1000, 3),
+        "stage_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+        "process_peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    })
+
+def run_isolated(stage: str, size: int, iterations: int, warmup: int, env: dict, timeout: float) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure, args=(stage, size, iterations, warmup, env, queue))
+    process.start()
+    result = collect_result(process, queue, timeout)
+    if "error" in result:
+        result.setdefault("stage", stage)
+        result.setdefault("size", size)
+    return result
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def print_comparison(results: list, baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as fh:
+        baseline = {(r["stage"], r["size"]): r for r in json.load(fh)["results"] if "error" not in r}
+    print(f"\nChange vs {baseline_path} (p50, negative is faster):")
+    for result in results:
+        previous = baseline.get((result["stage"], result["size"]))
+        if previous and "error" not in result and previous["p50_ms"]:
+            change = (result["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+            print(f"  {result['stage']:<28} {result['size']:>6} {result['size_unit']:<22} {change:+7.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--quick", action="store_true", help="Run only the smaller fixture sizes")
+    parser.add_argument("--stub-latency-ms", type=float, default=0,
+                        help="Latency injected by the stub backends per request (default 0: measure app code only)")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for each stage and size")
+    parser.add_argument("--output", default="benchmark_results.json", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for stage in args.stages:
+            _, unit, sizes, quick_sizes, size_env = STAGES[stage]
+            for size in quick_sizes if args.quick else sizes:
+                env = {
+                    **BENCH_ENV,
+                    "RESUMEMATCH_CACHE_DIR": os.path.join(cache_dir, f"{stage}-{size}"),
+                    "RESUMEMATCH_STUB_LATENCY_MS": str(args.stub_latency_ms),
+                    **(size_env(size) if size_env else {})
+                }
+                result = run_isolated(stage, size, args.iterations, args.warmup, env, args.timeout)
+                results.append(result)
+                if "error" in result:
+                    print(f"{stage:<28} {size:>6} {unit:<22} failed: {result['error']}")
+                    continue
+                print(f"{stage:<28} {size:>6} {unit:<22} {result['ops_per_sec']:>10} ops/s  "
+                      f"p50 {result['p50_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms  "
+                      f"stage RSS +{result['stage_rss_kb'] / 1024:.1f} MB  "
+                      f"process peak {result['process_peak_rss_kb'] / 1024:.1f} MB")
+
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump({
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "stub_latency_ms": args.stub_latency_ms,
+            "results": results
+        }, fh, indent=2)
+
+    if args.baseline:
+        print_comparison(results, args.baseline)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Deferred imports for heavy optional code paths of ResumeMatch Pro.
+
+Charts (plotly), tables (pandas) and tokenization (tiktoken) are only needed once a
+session reaches them, yet importing them up front costs most of the app's cold
+start. A LazyModule stands in for the module and imports it on first attribute
+access; after that, lookups go straight to sys.modules.
+"""
+import importlib
+import types
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = name
+
+    def _load(self) -> types.ModuleType:
+        # importlib serializes concurrent first imports with the module import lock
+        return importlib.import_module(self.__dict__["_lazy_target"])
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__dict__['_lazy_target']!r}>"
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module name that defers the import until it is used."""
+    return LazyModule(name)
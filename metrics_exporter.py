@@ -0,0 +1,279 @@
+"""Prometheus metrics for ResumeMatch Pro.
+
+A small dependency-free registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format. Kept in its own module (rather than
+app.py, which Streamlit re-executes on every rerun) so values accumulate for the
+life of the process.
+
+Metrics are exposed on a local HTTP endpoint when RESUMEMATCH_METRICS_PORT is set,
+and/or written periodically to RESUMEMATCH_METRICS_TEXTFILE for node_exporter's
+textfile collector.
+"""
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_PORT = int(os.getenv("RESUMEMATCH_METRICS_PORT", "0"))
+METRICS_ADDR = os.getenv("RESUMEMATCH_METRICS_ADDR", "127.0.0.1")
+METRICS_TEXTFILE = os.getenv("RESUMEMATCH_METRICS_TEXTFILE", "")
+METRICS_TEXTFILE_INTERVAL = float(os.getenv("RESUMEMATCH_METRICS_TEXTFILE_INTERVAL", "15"))
+# Distinguishes series from several instances written to one node_exporter directory
+METRICS_INSTANCE = os.getenv("RESUMEMATCH_METRICS_INSTANCE", "")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LLM_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60)
+GITHUB_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+
+logger = logging.getLogger(__name__)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _format_labels(names, values, const_labels: dict) -> str:
+    pairs = list(const_labels.items()) + list(zip(names, values))
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self, const_labels: dict) -> list:
+        raise NotImplementedError
+
+    def render(self, const_labels: dict) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples(const_labels))
+        return "\n".join(lines)
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self, const_labels: dict) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key, const_labels)} {_format_value(value)}"
+                for key, value in items]
+
+class Gauge(_Metric):
+    """Last set value per label set."""
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    _samples = Counter._samples
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LLM_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    state["buckets"][i] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def _samples(self, const_labels: dict) -> list:
+        with self._lock:
+            items = sorted((key, {**state, "buckets": list(state["buckets"])}) for key, state in self._values.items())
+        lines = []
+        for key, state in items:
+            for upper, count in zip(self.buckets, state["buckets"]):
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(upper),), const_labels)
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labelnames, key, const_labels)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+class MetricsRegistry:
+    """Named metrics rendered together in the Prometheus text format."""
+
+    def __init__(self, const_labels: dict = None):
+        self.const_labels = dict(const_labels or {})
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        # Get-or-create, so re-registering the same metric returns the live instance
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = cls(name, *args, **kwargs)
+            return self._metrics[name]
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=LLM_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render(self.const_labels) for metric in metrics) + "\n"
+
+REGISTRY = MetricsRegistry({"instance_name": METRICS_INSTANCE} if METRICS_INSTANCE else None)
+
+LLM_REQUESTS = REGISTRY.counter(
+    "resumematch_llm_requests_total",
+    "LLM requests by outcome (success, error, cache_hit).",
+    ("model", "analysis_type", "outcome")
+)
+LLM_LATENCY = REGISTRY.histogram(
+    "resumematch_llm_request_duration_seconds",
+    "Wall time of LLM requests sent to Groq, excluding cache hits.",
+    ("model", "analysis_type"),
+    buckets=LLM_LATENCY_BUCKETS
+)
+LLM_FIRST_TOKEN = REGISTRY.histogram(
+    "resumematch_llm_time_to_first_token_seconds",
+    "Time until the first streamed token arrives from Groq.",
+    ("model", "analysis_type"),
+    buckets=LLM_LATENCY_BUCKETS
+)
+LLM_TOKENS = REGISTRY.counter(
+    "resumematch_llm_tokens_total",
+    "Tokens reported by Groq usage, by kind (prompt, completion).",
+    ("model", "analysis_type", "kind")
+)
+GITHUB_REQUESTS = REGISTRY.counter(
+    "resumematch_github_requests_total",
+    "GitHub API requests by endpoint and HTTP status (error for network failures).",
+    ("endpoint", "status")
+)
+GITHUB_LATENCY = REGISTRY.histogram(
+    "resumematch_github_request_duration_seconds",
+    "Wall time of GitHub API requests.",
+    ("endpoint",),
+    buckets=GITHUB_LATENCY_BUCKETS
+)
+GITHUB_RATE_LIMIT_REMAINING = REGISTRY.gauge(
+    "resumematch_github_rate_limit_remaining",
+    "Requests left in the current GitHub rate-limit window, from the last response."
+)
+GITHUB_RATE_LIMIT_RESET = REGISTRY.gauge(
+    "resumematch_github_rate_limit_reset_timestamp_seconds",
+    "Unix time at which the GitHub rate-limit window resets."
+)
+
+def record_llm_call(model: str, analysis_type: str, outcome: str, seconds: float = None, usage=None) -> None:
+    """Count one LLM request; seconds and token usage are recorded for calls that reached Groq."""
+    LLM_REQUESTS.inc(model=model, analysis_type=analysis_type, outcome=outcome)
+    if seconds is not None:
+        LLM_LATENCY.observe(seconds, model=model, analysis_type=analysis_type)
+    if usage is not None:
+        LLM_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, model=model, analysis_type=analysis_type, kind="prompt")
+        LLM_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, model=model, analysis_type=analysis_type, kind="completion")
+
+def github_endpoint(url: str) -> str:
+    """Bucket a GitHub API URL into a low-cardinality endpoint label."""
+    path = url.split("?", 1)[0].rstrip("/")
+    if path.endswith("/languages"):
+        return "languages"
+    if path.endswith("/repos"):
+        return "repos"
+    return "other"
+
+def record_github_request(url: str, status, seconds: float) -> None:
+    endpoint = github_endpoint(url)
+    GITHUB_REQUESTS.inc(endpoint=endpoint, status=status)
+    GITHUB_LATENCY.observe(seconds, endpoint=endpoint)
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def write_textfile(path: str) -> None:
+    """Atomically write the current metrics, so the collector never reads a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(REGISTRY.render())
+    os.replace(tmp_path, path)
+
+def _textfile_loop(path: str, interval: float) -> None:
+    while True:
+        try:
+            write_textfile(path)
+        except OSError as e:
+            logger.warning("Could not write metrics textfile %s: %s", path, e)
+        time.sleep(interval)
+
+_started = False
+_start_lock = threading.Lock()
+
+def start_exporters() -> None:
+    """Start the configured HTTP endpoint and textfile writer once per process."""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+
+    if METRICS_PORT:
+        try:
+            server = ThreadingHTTPServer((METRICS_ADDR, METRICS_PORT), _MetricsHandler)
+        except OSError as e:
+            logger.warning("Metrics endpoint not started on %s:%s: %s", METRICS_ADDR, METRICS_PORT, e)
+        else:
+            threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+    if METRICS_TEXTFILE:
+        path = METRICS_TEXTFILE.replace("{pid}", str(os.getpid()))
+        threading.Thread(target=_textfile_loop, args=(path, METRICS_TEXTFILE_INTERVAL),
+                         name="metrics-textfile", daemon=True).start()
@@ -0,0 +1,147 @@
+"""Pluggable PDF text extraction engine for ResumeMatch Pro.
+
+Kept in its own module (rather than app.py) so the page-range workers can be
+pickled and imported by process-pool children started with the spawn method.
+"""
+import io
+import os
+import importlib.util
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Backend preference for "auto": fastest available first, PyPDF2 always last
+BACKEND_PREFERENCE = ["pymupdf", "pypdfium2", "pypdf2"]
+
+PDF_BACKEND = os.getenv("RESUMEMATCH_PDF_BACKEND", "auto").lower()
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("RESUMEMATCH_PDF_PARALLEL_MIN_PAGES", "16"))
+PDF_WORKERS = max(1, int(os.getenv("RESUMEMATCH_PDF_WORKERS", str(min(4, os.cpu_count() or 1)))))
+
+def _pymupdf_page_count(data: bytes) -> int:
+    import fitz
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return len(doc)
+
+def _pymupdf_iter_pages(data: bytes, start: int = 0, stop: int = None):
+    import fitz
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        total_pages = len(doc)
+        for i in range(start, total_pages if stop is None else stop):
+            yield total_pages, doc[i].get_text() or ""
+
+def _pypdfium2_page_count(data: bytes) -> int:
+    import pypdfium2 as pdfium
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def _pypdfium2_iter_pages(data: bytes, start: int = 0, stop: int = None):
+    import pypdfium2 as pdfium
+    pdf = pdfium.PdfDocument(data)
+    try:
+        total_pages = len(pdf)
+        for i in range(start, total_pages if stop is None else stop):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield total_pages, textpage.get_text_range() or ""
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+def _pypdf2_page_count(data: bytes) -> int:
+    import PyPDF2
+    return len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+
+def _pypdf2_iter_pages(data: bytes, start: int = 0, stop: int = None):
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    total_pages = len(reader.pages)
+    for i in range(start, total_pages if stop is None else stop):
+        yield total_pages, reader.pages[i].extract_text() or ""
+
+# name -> (import name used to probe availability, page counter, page iterator)
+# Page iterators open the document once and yield (total_pages, page_text)
+PDF_BACKENDS = {
+    "pymupdf": ("fitz", _pymupdf_page_count, _pymupdf_iter_pages),
+    "pypdfium2": ("pypdfium2", _pypdfium2_page_count, _pypdfium2_iter_pages),
+    "pypdf2": ("PyPDF2", _pypdf2_page_count, _pypdf2_iter_pages),
+}
+
+def available_backends() -> list:
+    """Return the installed backends in preference order."""
+    return [name for name in BACKEND_PREFERENCE
+            if importlib.util.find_spec(PDF_BACKENDS[name][0]) is not None]
+
+def resolve_backend(name: str = None) -> str:
+    """Resolve a backend name (or "auto") to an installed backend, defaulting to PyPDF2."""
+    name = (name or PDF_BACKEND).lower()
+    installed = available_backends()
+    if name != "auto" and name in installed:
+        return name
+    return installed[0] if installed else "pypdf2"
+
+def extract_page_range(backend: str, data: bytes, start: int, stop: int) -> list:
+    """Extract pages [start, stop) with one backend; the unit of work sent to pool workers."""
+    return [text for _, text in PDF_BACKENDS[backend][2](data, start, stop)]
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared page-extraction process pool, creating it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn avoids forking a multi-threaded Streamlit server
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+def extract_pdf_pages(data: bytes, backend: str = None, progress_callback=None, parallel: bool = None) -> list:
+    """Extract the text of every page of a PDF, in page order.
+
+    Documents with at least PDF_PARALLEL_MIN_PAGES pages are split into page ranges
+    parsed in a process pool when more than one worker is configured; pass parallel
+    to force either path. progress_callback(pages_done, total_pages) is called as
+    pages (or page ranges) finish.
+    """
+    backend = resolve_backend(backend)
+    _, count_pages, iter_pages = PDF_BACKENDS[backend]
+
+    total_pages = None
+    if parallel or (parallel is None and PDF_WORKERS > 1):
+        total_pages = count_pages(data)
+        parallel = total_pages >= 2 and (parallel or total_pages >= PDF_PARALLEL_MIN_PAGES)
+
+    if not parallel:
+        texts = []
+        for total_pages, text in iter_pages(data):
+            texts.append(text)
+            if progress_callback:
+                progress_callback(len(texts), total_pages)
+        return texts
+
+    # A few ranges per worker keeps the pool busy when pages differ in cost
+    range_count = min(total_pages, PDF_WORKERS * 4)
+    step = -(-total_pages // range_count)
+    ranges = [(start, min(start + step, total_pages)) for start in range(0, total_pages, step)]
+
+    pool = get_process_pool()
+    futures = {pool.submit(extract_page_range, backend, data, start, stop): start for start, stop in ranges}
+    texts_by_start = {}
+    pages_done = 0
+    for future in as_completed(futures):
+        page_texts = future.result()
+        texts_by_start[futures[future]] = page_texts
+        pages_done += len(page_texts)
+        if progress_callback:
+            progress_callback(pages_done, total_pages)
+
+    return [text for start, _ in ranges for text in texts_by_start[start]]
@@ -0,0 +1,373 @@
+"""Swappable transports for the Groq and GitHub HTTP calls made by ResumeMatch Pro.
+
+Each service runs against one backend, chosen by environment variable:
+
+- live: real network calls (the default)
+- record: real network calls, with every response also written to a cassette directory
+- replay: responses served from recorded cassettes, with no network and no API keys
+- stub: deterministic synthetic responses generated in-process
+
+replay and stub can inject latency, so the whole analysis pipeline can be load
+tested offline and reproducibly. Groq calls go through an httpx transport handed to
+the SDK client; GitHub calls go through a requests adapter mounted on the session.
+"""
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from groq import DefaultHttpxClient
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+BACKEND_MODES = ("live", "record", "replay", "stub")
+OFFLINE_MODES = ("replay", "stub")
+
+DEFAULT_BACKEND = os.getenv("RESUMEMATCH_BACKEND", "live").lower()
+LLM_BACKEND = os.getenv("RESUMEMATCH_LLM_BACKEND", DEFAULT_BACKEND).lower()
+GITHUB_BACKEND = os.getenv("RESUMEMATCH_GITHUB_BACKEND", DEFAULT_BACKEND).lower()
+# Under the git-ignored cache directory by default: recordings hold real resumes and API responses
+CASSETTE_DIR = os.getenv("RESUMEMATCH_CASSETTE_DIR",
+                         os.path.join(os.getenv("RESUMEMATCH_CACHE_DIR", ".resumematch_cache"), "cassettes"))
+
+# Latency injected by replay and stub backends
+STUB_LATENCY_MS = float(os.getenv("RESUMEMATCH_STUB_LATENCY_MS", "0"))
+STUB_JITTER_MS = float(os.getenv("RESUMEMATCH_STUB_JITTER_MS", "0"))
+STUB_TOKEN_MS = float(os.getenv("RESUMEMATCH_STUB_TOKEN_MS", "0"))
+
+# Shape of stub responses
+STUB_COMPLETION_TOKENS = int(os.getenv("RESUMEMATCH_STUB_COMPLETION_TOKENS", "300"))
+STUB_GITHUB_REPOS = int(os.getenv("RESUMEMATCH_STUB_GITHUB_REPOS", "40"))
+
+for _name, _mode in (("RESUMEMATCH_LLM_BACKEND", LLM_BACKEND), ("RESUMEMATCH_GITHUB_BACKEND", GITHUB_BACKEND)):
+    # Fail loudly: a typo must not silently send a load test to the live APIs
+    if _mode not in BACKEND_MODES:
+        raise ValueError(f"{_name} must be one of {', '.join(BACKEND_MODES)}, got {_mode!r}")
+
+# Headers that describe the wire encoding rather than the body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+def is_offline(mode: str) -> bool:
+    """True when a backend never touches the network, so no credentials are needed."""
+    return mode in OFFLINE_MODES
+
+def backend_label() -> str:
+    """Short name for the active backend pair, or "" when both services are live."""
+    if LLM_BACKEND == "live" and GITHUB_BACKEND == "live":
+        return ""
+    return f"llm-{LLM_BACKEND}_github-{GITHUB_BACKEND}"
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(str(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+def request_key(method: str, url: str, body) -> str:
+    """Stable cassette key for a request; query parameters and JSON bodies are order-insensitive."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    body = body or b""
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode("utf-8")
+    except ValueError:
+        pass
+    payload = b"\n".join([method.upper().encode(), _normalize_url(url).encode(), body])
+    return hashlib.sha256(payload).hexdigest()
+
+def injected_latency(key: str) -> float:
+    """Seconds to wait before answering; jitter is derived from the request key so runs repeat exactly."""
+    jitter = int(key[:8], 16) / 0xFFFFFFFF * STUB_JITTER_MS
+    return (STUB_LATENCY_MS + jitter) / 1000
+
+def _kept_headers(headers) -> dict:
+    return {name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS}
+
+class Cassette:
+    """Directory of recorded responses, one JSON file per request key."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def load(self, key: str):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, record: dict) -> None:
+        path = self._path(key)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(record, fh, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+def _missing_record(service: str, method: str, url: str, key: str) -> dict:
+    # 404 rather than 5xx so the Groq SDK does not retry a miss that can never succeed
+    message = f"No recorded {service} response for {method} {url} (key {key[:12]}); record it with the record backend"
+    body = {"error": {"message": message, "type": "cassette_miss"}} if service == "groq" else {"message": message}
+    return {"status": 404, "headers": {"Content-Type": "application/json"}, "body": json.dumps(body)}
+
+# ---------------------------------------------------------------------------
+# Stub responses
+# ---------------------------------------------------------------------------
+
+STUB_WORDS = (
+    "python go rust typescript react django kafka spark airflow kubernetes docker terraform "
+    "aws postgres redis graphql grpc api pipeline streaming ml pytorch nlp dashboard service "
+    "scalable reliable latency throughput migration ownership mentoring delivery testing"
+).split()
+STUB_LANGUAGES = ["Python", "Go", "Rust", "TypeScript", "JavaScript", "Java", "C++", "Shell"]
+
+def _stub_words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(STUB_WORDS) for _ in range(count))
+
+def stub_completion_text(messages: list, max_tokens: int, key: str) -> str:
+    """Deterministic completion shaped like the answer the prompt asks for."""
+    rng = random.Random(key)
+    system = messages[0].get("content", "") if messages else ""
+    user = messages[-1].get("content", "") if messages else ""
+    length = max(1, min(max_tokens or STUB_COMPLETION_TOKENS, STUB_COMPLETION_TOKENS))
+
+    if '"skills"' in system:
+        scores = {name: rng.randint(40, 95) for name in ["skills", "experience", "education", "keywords", "certifications"]}
+        return json.dumps(scores, indent=2)
+    if "TITLE:" in user:
+        return (
+            f"TITLE: {_stub_words(rng, 3).title()}\n"
+            "DESCRIPTION:\n"
+            f"• {_stub_words(rng, 14).capitalize()}\n"
+            f"• {_stub_words(rng, 14).capitalize()}\n"
+            f"TECHNOLOGIES: {', '.join(rng.sample(STUB_LANGUAGES, 3))}"
+        )
+    header = (
+        f"FIT SCORE: {rng.randint(40, 95)}%\n"
+        f"KEYWORD MATCH PERCENTAGE: {rng.randint(40, 95)}%\n\n"
+    )
+    return header + _stub_words(rng, max(0, length - len(header.split())))
+
+def _stub_completion(payload: dict, key: str):
+    """Return (completion dict, completion text) for a chat request payload."""
+    messages = payload.get("messages", [])
+    text = stub_completion_text(messages, payload.get("max_tokens"), key)
+    prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in messages)
+    completion_tokens = len(text.split())
+    completion = {
+        "id": f"stub-{key[:16]}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": payload.get("model", ""),
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+    return completion, text
+
+def _iter_stub_stream(payload: dict, key: str):
+    """Yield server-sent events for a streamed stub completion, pacing tokens by STUB_TOKEN_MS."""
+    completion, text = _stub_completion(payload, key)
+    base = {"id": completion["id"], "object": "chat.completion.chunk", "created": 0, "model": completion["model"]}
+    time.sleep(injected_latency(key))
+    words = text.split(" ")
+    for i, word in enumerate(words):
+        delta = word if i == 0 else " " + word
+        event = {**base, "choices": [{"index": 0, "delta": {"content": delta}, "finish_reason": None}]}
+        yield f"data: {json.dumps(event)}\n\n".encode("utf-8")
+        if STUB_TOKEN_MS:
+            time.sleep(STUB_TOKEN_MS / 1000)
+    final = {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+    yield f"data: {json.dumps(final)}\n\n".encode("utf-8")
+    yield b"data: [DONE]\n\n"
+
+def _stub_repo(username: str, index: int) -> dict:
+    rng = random.Random(f"{username}:{index}")
+    name = "-".join(rng.sample(STUB_WORDS, rng.randint(1, 3))) + f"-{index}"
+    updated = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00Z"
+    return {
+        "name": name,
+        "full_name": f"{username}/{name}",
+        "fork": index % 7 == 6,
+        "description": _stub_words(rng, rng.randint(0, 20)) or None,
+        "html_url": f"https://github.com/{username}/{name}",
+        "language": rng.choice(STUB_LANGUAGES),
+        "languages_url": f"https://api.github.com/repos/{username}/{name}/languages",
+        "stargazers_count": rng.randint(0, 500),
+        "forks_count": rng.randint(0, 50),
+        "created_at": "2020-01-01T00:00:00Z",
+        "updated_at": updated,
+        "pushed_at": updated,
+        "topics": rng.sample(STUB_WORDS, rng.randint(0, 4)),
+        "size": rng.randint(10, 50000)
+    }
+
+def stub_github_record(url: str) -> dict:
+    """Deterministic GitHub API response for the repository listing and languages endpoints."""
+    parts = urlsplit(url)
+    path = parts.path.strip("/").split("/")
+    params = dict(parse_qsl(parts.query))
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "X-RateLimit-Remaining": "5000",
+        "X-RateLimit-Reset": str(int(time.time()) + 3600)
+    }
+
+    if len(path) == 3 and path[0] == "users" and path[2] == "repos":
+        page = max(1, int(params.get("page", 1)))
+        per_page = max(1, int(params.get("per_page", 30)))
+        start = (page - 1) * per_page
+        body = [_stub_repo(path[1], i) for i in range(start, min(start + per_page, STUB_GITHUB_REPOS))]
+        if start + per_page < STUB_GITHUB_REPOS:
+            next_query = urlencode({**params, "page": page + 1})
+            headers["Link"] = f'<{urlunsplit((parts.scheme, parts.netloc, parts.path, next_query, ""))}>; rel="next"'
+    elif len(path) == 4 and path[0] == "repos" and path[3] == "languages":
+        rng = random.Random(f"{path[1]}/{path[2]}")
+        body = {language: rng.randint(1000, 200000) for language in rng.sample(STUB_LANGUAGES, rng.randint(1, 3))}
+    else:
+        return {"status": 404, "headers": headers, "body": json.dumps({"message": "Not Found"})}
+
+    text = json.dumps(body)
+    headers["ETag"] = f'W/"{hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]}"'
+    return {"status": 200, "headers": headers, "body": text}
+
+# ---------------------------------------------------------------------------
+# Groq (httpx transport)
+# ---------------------------------------------------------------------------
+
+class GroqBackendTransport(httpx.BaseTransport):
+    """httpx transport that records, replays or stubs Groq API calls."""
+
+    def __init__(self, mode: str, cassette: Cassette):
+        self.mode = mode
+        self.cassette = cassette
+        self._live = httpx.HTTPTransport() if mode == "record" else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        key = request_key(request.method, str(request.url), body)
+
+        if self.mode == "record":
+            start = time.perf_counter()
+            response = self._live.handle_request(request)
+            response.read()
+            record = {
+                "request": {"method": request.method, "url": str(request.url)},
+                "status": response.status_code,
+                "headers": _kept_headers(response.headers),
+                "body": response.content.decode("utf-8", errors="replace"),
+                "elapsed": round(time.perf_counter() - start, 4)
+            }
+            # Only successful calls are worth replaying; errors would be cached forever
+            if response.status_code < 400:
+                self.cassette.save(key, record)
+            return httpx.Response(record["status"], headers=record["headers"], content=response.content, request=request)
+
+        if self.mode == "stub":
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                payload = {}
+            if payload.get("stream"):
+                return httpx.Response(200, headers={"Content-Type": "text/event-stream"},
+                                      content=_iter_stub_stream(payload, key), request=request)
+            completion, text = _stub_completion(payload, key)
+            record = {"status": 200, "headers": {"Content-Type": "application/json"}, "body": json.dumps(completion)}
+            delay = injected_latency(key) + STUB_TOKEN_MS * len(text.split()) / 1000
+        else:
+            record = self.cassette.load(key) or _missing_record("groq", request.method, str(request.url), key)
+            delay = injected_latency(key)
+
+        time.sleep(delay)
+        return httpx.Response(record["status"], headers=record["headers"], content=record["body"].encode("utf-8"), request=request)
+
+    def close(self) -> None:
+        if self._live is not None:
+            self._live.close()
+
+def groq_http_client():
+    """httpx client for the Groq SDK, or None to let the SDK use its default live client."""
+    if LLM_BACKEND == "live":
+        return None
+    transport = GroqBackendTransport(LLM_BACKEND, Cassette(os.path.join(CASSETTE_DIR, "groq")))
+    return DefaultHttpxClient(transport=transport)
+
+# ---------------------------------------------------------------------------
+# GitHub (requests adapter)
+# ---------------------------------------------------------------------------
+
+class GitHubBackendAdapter(HTTPAdapter):
+    """requests adapter that records, replays or stubs GitHub API calls."""
+
+    def __init__(self, mode: str, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+
+        if self.mode == "record":
+            # Record full bodies; a 304 answered from the local HTTP cache would leave nothing to replay
+            request.headers.pop("If-None-Match", None)
+            request.headers.pop("If-Modified-Since", None)
+            response = super().send(request, **kwargs)
+            if response.status_code < 400:
+                self.cassette.save(key, {
+                    "request": {"method": request.method, "url": request.url},
+                    "status": response.status_code,
+                    "headers": _kept_headers(response.headers),
+                    "body": response.text,
+                    "elapsed": round(response.elapsed.total_seconds(), 4)
+                })
+            return response
+
+        if self.mode == "stub":
+            record = stub_github_record(request.url)
+        else:
+            record = self.cassette.load(key) or _missing_record("github", request.method, request.url, key)
+
+        time.sleep(injected_latency(key))
+        return self._build_response(request, record)
+
+    def _build_response(self, request, record: dict) -> requests.Response:
+        response = requests.Response()
+        response.headers = CaseInsensitiveDict(record["headers"])
+        etag = response.headers.get("ETag")
+        # Honour conditional requests so the app's ETag cache behaves as it does against GitHub
+        if etag and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = record["status"]
+            response._content = record["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = HTTPStatus(response.status_code).phrase
+        response.connection = self
+        return response
+
+def github_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """Adapter for the GitHub session: a plain pooled HTTPAdapter when live."""
+    if GITHUB_BACKEND == "live":
+        return HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    return GitHubBackendAdapter(
+        GITHUB_BACKEND,
+        Cassette(os.path.join(CASSETTE_DIR, "github")),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize
+    )
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("RESUMEMATCH_BACKEND", "stub")
+
+import app
+
+RESUME = (
+    "Jane Doe\njane@example.com\n\n"
+    "EXPERIENCE\n"
+    "Data Engineer at Acme building Kafka pipelines.\n\n"
+    "Backend Engineer at Initech writing Go services.\n\n"
+    "Education:\n"
+    "BSc Computer Science, State University.\n"
+)
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    # One token per word keeps budgets readable and avoids loading tiktoken encodings
+    monkeypatch.setattr(app, "count_tokens", lambda text, model, memoize=False: len(text.split()))
+
+def test_chunks_never_cross_section_headers():
+    chunks = list(app.iter_resume_chunks(RESUME, max_tokens=100))
+    assert [chunk["section"] for chunk in chunks] == ["Header", "Experience", "Education"]
+    assert chunks[1]["text"].startswith("EXPERIENCE\n")
+    assert "Initech" in chunks[1]["text"] and "State University" not in chunks[1]["text"]
+    for chunk in chunks:
+        assert RESUME[chunk["start"]:chunk["end"]] == chunk["text"]
+
+def test_paragraphs_are_packed_up_to_the_token_limit():
+    chunks = list(app.iter_resume_chunks(RESUME, max_tokens=8))
+    experience = [chunk for chunk in chunks if chunk["section"] == "Experience"]
+    # The header rides along with the first paragraph instead of standing alone
+    assert [chunk["text"] for chunk in experience] == [
+        "EXPERIENCE\nData Engineer at Acme building Kafka pipelines.",
+        "Backend Engineer at Initech writing Go services.",
+    ]
+    assert all(chunk["tokens"] <= 8 for chunk in chunks)
+
+def test_oversized_paragraph_falls_back_to_words():
+    text = "SKILLS\n" + " ".join(f"skill{i}" for i in range(25))
+    chunks = app.chunk_text(text, max_tokens=10)
+    assert len(chunks) == 3
+    assert all(len(chunk.split()) <= 10 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
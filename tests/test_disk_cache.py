@@ -0,0 +1,39 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("RESUMEMATCH_BACKEND", "stub")
+
+import app
+
+def test_entry_expires_after_ttl(tmp_path, monkeypatch):
+    cache = app.DiskCache(str(tmp_path), max_bytes=1 << 20, ttl_seconds=60)
+    monkeypatch.setattr(app.time, "time", lambda: 1000.0)
+    cache.set("key", {"answer": 42})
+    monkeypatch.setattr(app.time, "time", lambda: 1059.0)
+    assert cache.get("key") == {"answer": 42}
+    monkeypatch.setattr(app.time, "time", lambda: 1061.0)
+    assert cache.get("key") is None
+    assert not os.path.exists(os.path.join(tmp_path, "key.json"))
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = app.DiskCache(str(tmp_path), max_bytes=1 << 20)
+    for age, key in enumerate(["c", "b", "a"]):
+        cache.set(key, "x" * 100)
+        # mtime is the access clock; spread it out so the order is unambiguous
+        os.utime(os.path.join(tmp_path, f"{key}.json"), (1000 - age, 1000 - age))
+    cache.max_bytes = os.path.getsize(os.path.join(tmp_path, "a.json")) * 3
+    assert cache.get("a") is not None
+    cache.set("d", "x" * 100)
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = app.DiskCache(str(tmp_path / "cache"), max_bytes=0)
+    cache.set("key", "value")
+    assert cache.get("key") is None
+    assert not os.path.exists(tmp_path / "cache")
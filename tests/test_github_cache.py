@@ -0,0 +1,53 @@
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("RESUMEMATCH_BACKEND", "stub")
+
+import app
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        status, body, response_headers = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response.headers.update(response_headers)
+        response._content = body.encode("utf-8")
+        return response
+
+def test_not_modified_is_answered_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "github_http_cache", app.DiskCache(str(tmp_path), max_bytes=1 << 20))
+    body = '[{"name": "kafka-pipeline"}]'
+    session = FakeSession([
+        (200, body, {"ETag": '"v1"', "Link": '<https://api.github.com/next>; rel="next"',
+                     "Content-Type": "application/json"}),
+        (304, "", {"ETag": '"v1"'}),
+    ])
+    url = "https://api.github.com/users/octocat/repos"
+
+    first = app.github_get(session, url, params={"page": 1})
+    second = app.github_get(session, url, params={"page": 1})
+
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert second.status_code == 200
+    assert second.json() == first.json() == [{"name": "kafka-pipeline"}]
+    assert second.links["next"]["url"] == "https://api.github.com/next"
+
+def test_response_without_validators_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "github_http_cache", app.DiskCache(str(tmp_path), max_bytes=1 << 20))
+    session = FakeSession([(200, "[]", {}), (200, "[]", {})])
+    url = "https://api.github.com/users/octocat/repos"
+
+    app.github_get(session, url)
+    app.github_get(session, url)
+
+    assert session.sent_headers == [{}, {}]
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics_exporter
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    registry = metrics_exporter.MetricsRegistry({"instance_name": "web-1"})
+    histogram = registry.histogram("request_seconds", "Request latency.", ("endpoint",), buckets=(0.5, 0.1, 1))
+    for seconds in (0.05, 0.3, 0.3, 2.5):
+        histogram.observe(seconds, endpoint="repos")
+
+    assert registry.render() == (
+        "# HELP request_seconds Request latency.\n"
+        "# TYPE request_seconds histogram\n"
+        'request_seconds_bucket{instance_name="web-1",endpoint="repos",le="0.1"} 1\n'
+        'request_seconds_bucket{instance_name="web-1",endpoint="repos",le="0.5"} 3\n'
+        'request_seconds_bucket{instance_name="web-1",endpoint="repos",le="1"} 3\n'
+        'request_seconds_bucket{instance_name="web-1",endpoint="repos",le="+Inf"} 4\n'
+        'request_seconds_sum{instance_name="web-1",endpoint="repos"} 3.15\n'
+        'request_seconds_count{instance_name="web-1",endpoint="repos"} 4\n'
+    )
+
+def test_label_values_are_escaped():
+    registry = metrics_exporter.MetricsRegistry()
+    registry.counter("errors_total", "Errors.", ("message",)).inc(message='bad "quote"\\\n')
+    assert 'errors_total{message="bad \\"quote\\"\\\\\\n"} 1' in registry.render()
+
+def test_metric_rejects_unexpected_labels():
+    histogram = metrics_exporter.MetricsRegistry().histogram("latency_seconds", "Latency.", ("model",))
+    with pytest.raises(ValueError):
+        histogram.observe(1.0, endpoint="repos")
+
+def test_registering_a_metric_twice_returns_the_same_instance():
+    registry = metrics_exporter.MetricsRegistry()
+    assert registry.counter("hits_total", "Hits.") is registry.counter("hits_total", "Hits.")
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("RESUMEMATCH_BACKEND", "stub")
+
+import app
+
+RESUME = (
+    "SUMMARY\nBackend engineer focused on reliable services.\n\n"
+    "EXPERIENCE\nBuilt Kafka streaming pipelines and Spark batch jobs at Acme.\n\n"
+    "PROJECTS\nOpen source Kubernetes operator for Postgres backups.\n\n"
+    "EDUCATION\nBSc Computer Science from State University, graduated 2019.\n\n"
+    "CERTIFICATIONS\nAWS Certified Solutions Architect.\n"
+)
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    # One token per word keeps budgets readable and avoids loading tiktoken encodings
+    monkeypatch.setattr(app, "count_tokens", lambda text, model, memoize=False: len(text.split()))
+
+def sections(chunks):
+    return [chunk["section"] for chunk in chunks]
+
+def test_top_chunk_matches_question_terms():
+    index = app.ResumeChunkIndex(RESUME, max_tokens=20)
+    assert sections(index.top_chunks("Where did I study computer science?", k=1)) == ["Education"]
+    assert sections(index.top_chunks("Which Kafka pipelines have I built?", k=1)) == ["Experience"]
+
+def test_top_k_chunks_are_returned_in_resume_order():
+    index = app.ResumeChunkIndex(RESUME, max_tokens=20)
+    chunks = index.top_chunks("AWS certification and Kubernetes projects", k=2)
+    assert sections(chunks) == ["Projects", "Certifications"]
+
+def test_context_token_budget_skips_chunks_that_do_not_fit():
+    index = app.ResumeChunkIndex(RESUME, max_tokens=20)
+    question = "Kafka Spark streaming at Acme, and AWS certification"
+    assert sections(index.top_chunks(question, k=2)) == ["Experience", "Certifications"]
+    # The experience chunk alone uses the budget, so the certification chunk is skipped
+    assert sections(index.top_chunks(question, k=2, max_tokens=10)) == ["Experience"]
+
+def test_question_without_matching_terms_falls_back_to_opening_chunks():
+    index = app.ResumeChunkIndex(RESUME, max_tokens=20)
+    assert sections(index.top_chunks("zzz qqq", k=2)) == ["Summary", "Experience"]
+
+def test_chunk_index_is_memoized_per_resume():
+    assert app.get_resume_chunk_index(RESUME) is app.get_resume_chunk_index(RESUME)
+    assert app.get_resume_chunk_index(RESUME) is not app.get_resume_chunk_index(RESUME + "\nReferences on request.")
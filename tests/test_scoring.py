@@ -0,0 +1,60 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("RESUMEMATCH_BACKEND", "stub")
+
+import app
+
+def test_reduce_csr_rows_with_trailing_empty_rows():
+    indptr = np.array([0, 3, 3])
+    assert app.reduce_csr_rows(np.add, indptr, np.array([1, 1, 1])).tolist() == [3, 0]
+
+def test_reduce_csr_rows_with_interleaved_empty_rows():
+    indptr = np.array([0, 0, 2, 2, 3, 3])
+    assert app.reduce_csr_rows(np.add, indptr, np.array([1, 2, 4])).tolist() == [0, 3, 0, 4, 0]
+
+def test_reduce_csr_rows_2d_logical_or():
+    indptr = np.array([0, 2, 2])
+    values = np.array([[True, False], [False, False]])
+    assert app.reduce_csr_rows(np.logical_or, indptr, values).tolist() == [[True, False], [False, False]]
+
+def test_reduce_csr_rows_without_entries():
+    assert app.reduce_csr_rows(np.add, np.array([0, 0, 0]), np.array([], dtype=np.float64)).tolist() == [0, 0]
+
+def test_duplicate_penalty_does_not_depend_on_repo_order():
+    repos = [{"name": "a-b-c"}, {"name": "__"}]
+    existing = ["a b c tracker"]
+    forward = app.RepoTermIndex(repos).duplicate_penalties(existing)
+    backward = app.RepoTermIndex(repos[::-1]).duplicate_penalties(existing)
+    assert forward.tolist() == [5, 0]
+    assert backward.tolist() == [0, 5]
+
+def test_bm25_scores_do_not_depend_on_repo_order():
+    repos = [
+        {"name": "kafka-pipeline", "description": "Streaming ETL with Kafka and Spark", "languages": ["Python"]},
+        {"name": "spark-jobs", "description": "Batch Spark jobs on AWS"},
+        {"name": "__", "description": ""},
+        {"name": "--", "description": None},
+    ]
+    job = "Build streaming pipelines with Kafka and Spark on AWS"
+    forward = app.RepoTermIndex(repos).score(job, [])
+    backward = app.RepoTermIndex(repos[::-1]).score(job, [])
+    assert np.allclose(forward, backward[::-1])
+    assert forward[0] > forward[1] > 0
+
+def test_repo_index_terms_match_tokenize_terms():
+    repos = [
+        {"name": "Node.js-api", "description": "REST API in C++ and c#, see ...net docs. Café v2.0.", "topics": ["graphql"]},
+        {"name": "", "description": None},
+        {"name": "x\x00y", "description": "the and a İstanbul 3.14."},
+    ]
+    index = app.RepoTermIndex(repos)
+    vocabulary = list(index.vocabulary)
+    for row, repo in enumerate(repos):
+        text = " ".join([repo["name"], repo["description"] or "", *repo.get("topics", [])])
+        start, stop = index.bm25_indptr[row], index.bm25_indptr[row + 1]
+        assert sorted(vocabulary[i] for i in index.bm25_indices[start:stop]) == sorted(set(app.tokenize_terms(text)))
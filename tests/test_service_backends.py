@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+
+import httpx
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import service_backends
+
+CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
+REPOS_URL = "https://api.github.com/users/octocat/repos?per_page=100&page=1"
+
+def groq_client(mode, cassette, live=None):
+    transport = service_backends.GroqBackendTransport(mode, cassette)
+    if live is not None:
+        transport._live = live
+    return httpx.Client(transport=transport)
+
+def test_recorded_groq_call_replays_without_network(tmp_path):
+    cassette = service_backends.Cassette(str(tmp_path))
+    completion = {"choices": [{"message": {"role": "assistant", "content": "FIT SCORE: 80%"}}]}
+    live_calls = []
+
+    def live(request):
+        live_calls.append(request)
+        return httpx.Response(200, json=completion)
+
+    payload = {"model": "llama3-70b-8192", "messages": [{"role": "user", "content": "hi"}], "seed": 7}
+    with groq_client("record", cassette, httpx.MockTransport(live)) as client:
+        assert client.post(CHAT_URL, json=payload).json() == completion
+
+    # Same request with keys in another order hits the same cassette entry
+    reordered = json.dumps(dict(reversed(list(payload.items()))))
+    with groq_client("replay", cassette) as client:
+        response = client.post(CHAT_URL, content=reordered, headers={"Content-Type": "application/json"})
+    assert response.status_code == 200
+    assert response.json() == completion
+    assert len(live_calls) == 1
+
+def test_groq_replay_miss_is_a_non_retried_error(tmp_path):
+    with groq_client("replay", service_backends.Cassette(str(tmp_path))) as client:
+        response = client.post(CHAT_URL, json={"messages": []})
+    assert response.status_code == 404
+    assert response.json()["error"]["type"] == "cassette_miss"
+
+def test_github_replay_serves_recording_and_honours_etag(tmp_path):
+    cassette = service_backends.Cassette(str(tmp_path))
+    body = json.dumps([{"name": "kafka-pipeline"}])
+    cassette.save(service_backends.request_key("GET", REPOS_URL, None), {
+        "status": 200,
+        "headers": {"Content-Type": "application/json", "ETag": '"v1"'},
+        "body": body,
+    })
+    session = requests.Session()
+    session.mount("https://", service_backends.GitHubBackendAdapter("replay", cassette))
+
+    # Query parameters in a different order map to the same recording
+    response = session.get("https://api.github.com/users/octocat/repos?page=1&per_page=100")
+    assert response.status_code == 200
+    assert response.json() == [{"name": "kafka-pipeline"}]
+
+    revalidated = session.get(REPOS_URL, headers={"If-None-Match": '"v1"'})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    assert session.get("https://api.github.com/users/someone-else/repos").status_code == 404